@@ -1,6 +1,13 @@
 import json
+import asyncio
+import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from requests.adapters import HTTPAdapter
 from app.core.config import settings
+from ai.extraction.map_reduce import split_transcript, merge_insights
 
 EXTRACTION_PROMPT = """
 Extract the following information from this meeting transcript:
@@ -10,79 +17,119 @@ Extract the following information from this meeting transcript:
 4. Topics: Main discussion points
 
 Format as JSON:
-{
-  "action_items": [{"assignee": "...", "task": "...", "deadline": "..."}],
-  "decisions": [{"decision": "...", "made_by": "..."}],
-  "participants": [{"name": "...", "role": "..."}],
+{{
+  "action_items": [{{"assignee": "...", "task": "...", "deadline": "..."}}],
+  "decisions": [{{"decision": "...", "made_by": "..."}}],
+  "participants": [{{"name": "...", "role": "..."}}],
   "topics": ["..."]
-}
+}}
 
 Transcript:
 {transcript}
 """
 
-def extract_meeting_insights(transcript: str) -> dict:
-    """Extract insights from transcript using LLM"""
-    try:
-        # Using Ollama API
-        prompt = EXTRACTION_PROMPT.format(transcript=transcript)
-        
-        response = requests.post(
-            f"{settings.OLLAMA_API_URL}/api/generate",
-            json={
-                "model": "llama2",
-                "prompt": prompt,
-                "stream": False
-            }
+class ExtractionError(Exception):
+    """Raised when the LLM's answer holds no usable insights"""
+    pass
+
+class OllamaClient:
+    """Async client for Ollama's generate API
+
+    Requests share one pooled HTTP session and run on a thread pool sized to
+    settings.LLM_MAX_IN_FLIGHT, so however many extractions a worker has
+    going, the LLM server sees at most that many requests at once and the
+    rest wait their turn. Identical prompts already in flight (a retried
+    job, a duplicate upload) are coalesced into a single request.
+    """
+
+    def __init__(self, base_url: str, model: str, max_in_flight: int, timeout: float):
+        self.url = f"{base_url}/api/generate"
+        self.model = model
+        self.timeout = timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_in_flight)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="llm")
+        self._in_flight = {}
+
+    def _post(self, prompt: str) -> str:
+        response = self._session.post(
+            self.url,
+            json={"model": self.model, "prompt": prompt, "stream": False},
+            timeout=self.timeout
         )
-        
-        if response.status_code == 200:
-            result = response.json()
-            # Parse the response to extract JSON
-            try:
-                # Try to find JSON in the response
-                content = result.get('response', '')
-                # Simple JSON extraction (in real implementation, you'd want better parsing)
-                start = content.find('{')
-                end = content.rfind('}') + 1
-                if start != -1 and end != 0:
-                    json_str = content[start:end]
-                    return json.loads(json_str)
-            except:
-                pass
-        
-        # Fallback: return sample data
-        return {
-            "action_items": [
-                {"assignee": "John Smith", "task": "Complete marketing campaign", "deadline": "2023-12-15"},
-                {"assignee": "Sarah Johnson", "task": "Prepare client presentation", "deadline": "2023-12-10"},
-                {"assignee": "Mike Davis", "task": "Set up project management tool", "deadline": "2023-12-05"}
-            ],
-            "decisions": [
-                {"decision": "Use new software tool for project management", "made_by": "Team consensus"},
-                {"decision": "Allocate additional budget for marketing", "made_by": "Management"}
-            ],
-            "participants": [
-                {"name": "John Smith", "role": "Marketing Lead"},
-                {"name": "Sarah Johnson", "role": "Client Relations"},
-                {"name": "Mike Davis", "role": "Technical Lead"}
-            ],
-            "topics": ["Project Timeline", "Budget Allocation", "Team Responsibilities", "Software Tools"]
-        }
-        
-    except Exception as e:
-        # Fallback for demo purposes
-        return {
-            "action_items": [
-                {"assignee": "John Smith", "task": "Complete marketing campaign", "deadline": "2023-12-15"},
-                {"assignee": "Sarah Johnson", "task": "Prepare client presentation", "deadline": "2023-12-10"}
-            ],
-            "decisions": [
-                {"decision": "Use new software tool for project management", "made_by": "Team consensus"}
-            ],
-            "participants": [
-                {"name": "John Smith", "role": "Marketing Lead"},
-                {"name": "Sarah Johnson", "role": "Client Relations"}
-            ],
-            "topics": ["Project Timeline", "Budget Allocation"]
-        }
\ No newline at end of file
+        response.raise_for_status()
+        return response.json().get("response", "")
+
+    async def generate(self, prompt: str) -> str:
+        """Completion text for a prompt"""
+        key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_event_loop()
+            future = asyncio.ensure_future(loop.run_in_executor(self._executor, self._post, prompt))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so one caller giving up doesn't cancel the request for the others
+        return await asyncio.shield(future)
+
+# Global instance, created on first use so importing this module stays cheap
+_client = None
+_client_lock = threading.Lock()
+
+def get_llm_client() -> OllamaClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OllamaClient(
+                    settings.OLLAMA_API_URL,
+                    settings.LLM_MODEL,
+                    settings.LLM_MAX_IN_FLIGHT,
+                    settings.LLM_TIMEOUT
+                )
+    return _client
+
+def parse_insights(content: str):
+    """The JSON object in an LLM answer, or None if there isn't a valid one"""
+    start = content.find('{')
+    end = content.rfind('}') + 1
+    if start == -1 or end == 0:
+        return None
+    try:
+        insights = json.loads(content[start:end])
+    except ValueError:
+        return None
+    return insights if isinstance(insights, dict) else None
+
+async def _extract_chunk(text: str) -> dict:
+    """Insights from one prompt's worth of transcript"""
+    content = await get_llm_client().generate(EXTRACTION_PROMPT.format(transcript=text))
+    insights = parse_insights(content)
+    if insights is None:
+        raise ExtractionError(f"LLM answer has no JSON insights: {content[:200]!r}")
+    return insights
+
+async def extract_meeting_insights(transcript: str, segments: Optional[List[str]] = None) -> dict:
+    """Extract insights from transcript using LLM
+
+    In map_reduce mode a transcript longer than settings.EXTRACT_CHUNK_CHARS
+    is split (between segments, when their texts are given), the chunks are
+    extracted concurrently and the results merged, so no prompt outgrows the
+    model's context and time per chunk stays bounded however long the meeting.
+    Request failures and unparseable answers raise, so the job is retried
+    rather than completed with partial insights.
+    """
+    chunks = [transcript]
+    if settings.EXTRACTION_MODE == "map_reduce":
+        chunks = split_transcript(transcript, segments, settings.EXTRACT_CHUNK_CHARS) or [transcript]
+    
+    if len(chunks) == 1:
+        results = [await _extract_chunk(chunks[0])]
+    else:
+        # Chunks are queued together; the client bounds how many reach the LLM at once
+        results = await asyncio.gather(*(_extract_chunk(chunk) for chunk in chunks))
+        print(f"Extracted {len(chunks)} transcript chunks")
+    # Merging also drops malformed fields and duplicates within a single answer
+    return merge_insights(results)
@@ -0,0 +1,81 @@
+import re
+import textwrap
+from typing import List, Optional
+
+# Cut points for transcripts without stored segments
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+def split_transcript(transcript: str, segments: Optional[List[str]], max_chars: int) -> List[str]:
+    """Transcript text in chunks of at most max_chars
+
+    Chunks are cut between Whisper segments, which end at pauses, or between
+    sentences when there are no segments. A piece longer than max_chars on
+    its own is cut between words.
+    """
+    pieces = segments if segments else SENTENCE_END.split(transcript)
+    chunks = []
+    current = []
+    size = 0
+    for piece in pieces:
+        piece = piece.strip()
+        if not piece:
+            continue
+        for part in textwrap.wrap(piece, max_chars) if len(piece) > max_chars else [piece]:
+            if current and size + len(part) > max_chars:
+                chunks.append(" ".join(current))
+                current, size = [], 0
+            current.append(part)
+            size += len(part) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+def _key(value) -> str:
+    """Comparison key that ignores case, punctuation and spacing"""
+    return re.sub(r"[\W_]+", " ", str(value or "")).strip().casefold()
+
+# Insight list -> field an item must have and the fields identifying duplicates
+ENTITY_KEYS = {
+    "action_items": ("task", ("assignee", "task")),
+    "decisions": ("decision", ("decision",)),
+    "participants": ("name", ("name",)),
+}
+
+def _items(part: dict, field: str) -> list:
+    # LLMs sometimes answer a list field with a bare string or object
+    value = part.get(field)
+    return value if isinstance(value, list) else []
+
+def merge_insights(parts: List[dict]) -> dict:
+    """Combine per-chunk extraction results into one, in transcript order
+
+    People, tasks and topics mentioned in several chunks come back from each
+    of them; duplicates are dropped, with fields missing from the first
+    mention (a deadline, a role) filled in from later ones. Fields that
+    aren't lists are ignored, so the result always has the expected shape.
+    """
+    merged = {field: [] for field in (*ENTITY_KEYS, "topics")}
+    seen = {field: {} for field in merged}
+
+    for part in parts:
+        for field, (required, identity) in ENTITY_KEYS.items():
+            for item in _items(part, field):
+                if not isinstance(item, dict) or not _key(item.get(required)):
+                    continue
+                key = tuple(_key(item.get(name)) for name in identity)
+                existing = seen[field].get(key)
+                if existing is None:
+                    seen[field][key] = dict(item)
+                    merged[field].append(seen[field][key])
+                    continue
+                for name, value in item.items():
+                    if value and not existing.get(name):
+                        existing[name] = value
+
+        for topic in _items(part, "topics"):
+            key = _key(topic)
+            if isinstance(topic, str) and key and key not in seen["topics"]:
+                seen["topics"][key] = topic
+                merged["topics"].append(topic)
+
+    return merged
@@ -1,9 +1,10 @@
-import chromadb
+import threading
 from typing import List, Dict, Any
 from app.core.config import settings
 
 class ChromaSearchClient:
     def __init__(self):
+        import chromadb
         self.client = chromadb.HttpClient(
             host=settings.CHROMA_HOST,
             port=settings.CHROMA_PORT
@@ -40,5 +41,15 @@ class ChromaSearchClient:
             "distances": results["distances"][0] if "distances" in results else []
         }
 
-# Global instance
-search_client = ChromaSearchClient()
\ No newline at end of file
+# Global instance, connected on first use so importing this module stays cheap
+_search_client = None
+_search_client_lock = threading.Lock()
+
+def get_search_client() -> ChromaSearchClient:
+    """Return the shared search client, connecting on first call"""
+    global _search_client
+    if _search_client is None:
+        with _search_client_lock:
+            if _search_client is None:
+                _search_client = ChromaSearchClient()
+    return _search_client
\ No newline at end of file
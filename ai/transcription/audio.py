@@ -0,0 +1,276 @@
+import os
+import struct
+import subprocess
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+from app.core.config import settings
+
+# Whisper operates on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# PCM cache layout: fixed 32-byte little-endian header followed by raw int16 mono samples
+PCM_MAGIC = b"MPCM"
+PCM_VERSION = 1
+PCM_HEADER = struct.Struct("<4sHHIQ12x")  # magic, version, channels, sample_rate, num_samples
+
+# Bytes read from ffmpeg per write while building a cache (about 2s of audio)
+PCM_READ_CHUNK = 64 * 1024
+
+# Frame length used when looking for quiet split points
+SILENCE_FRAME_SECONDS = 0.02
+
+# Voice activity detection frame length and samples scanned per block
+VAD_FRAME_SECONDS = 0.03
+VAD_BLOCK_FRAMES = 2000
+
+def _ffmpeg_decode_command(file_path: str) -> list:
+    # ffmpeg demuxes, downmixes and resamples in a single stream straight to
+    # stdout, so no intermediate WAV is written and Whisper never re-decodes
+    return [
+        settings.FFMPEG_BINARY, "-nostdin",
+        "-threads", "0",
+        "-i", file_path,
+        "-vn",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(SAMPLE_RATE),
+        "-"
+    ]
+
+def decode_audio(file_path: str) -> np.ndarray:
+    """Decode any audio/video file to a 16 kHz mono float32 waveform in one pass"""
+    result = subprocess.run(_ffmpeg_decode_command(file_path), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to decode audio: {result.stderr.decode(errors='ignore')[-500:]}")
+
+    return pcm16_to_float32(np.frombuffer(result.stdout, np.int16))
+
+def pcm16_to_float32(samples: np.ndarray) -> np.ndarray:
+    """Convert int16 PCM samples to the float32 [-1, 1) range Whisper expects"""
+    return samples.astype(np.float32) / 32768.0
+
+class PcmAudio:
+    """Read-only, memory-mapped view of a PCM cache file"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            header = f.read(PCM_HEADER.size)
+        if len(header) < PCM_HEADER.size:
+            raise ValueError(f"Not a PCM cache file: {path}")
+
+        magic, version, channels, sample_rate, num_samples = PCM_HEADER.unpack(header)
+        if magic != PCM_MAGIC or version != PCM_VERSION or channels != 1:
+            raise ValueError(f"Unsupported PCM cache file: {path}")
+
+        self.path = path
+        self.sample_rate = sample_rate
+        # Pages are only faulted in for the windows actually sliced
+        self.samples = np.memmap(
+            path, dtype=np.int16, mode="r",
+            offset=PCM_HEADER.size, shape=(num_samples,)
+        ) if num_samples else np.zeros(0, dtype=np.int16)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    def view(self, start: float, end: float) -> np.ndarray:
+        """Zero-copy int16 slice between two timestamps in seconds"""
+        return self.samples[int(start * self.sample_rate):int(end * self.sample_rate)]
+
+    def window(self, start: float, end: float) -> np.ndarray:
+        """float32 copy of a single window, ready to hand to Whisper"""
+        return pcm16_to_float32(self.view(start, end))
+
+    def gather(self, spans: List[Tuple[float, float]]) -> np.ndarray:
+        """float32 copy of several spans joined back to back"""
+        if len(spans) == 1:
+            return self.window(*spans[0])
+        return pcm16_to_float32(np.concatenate([self.view(start, end) for start, end in spans]))
+
+def quietest_point(pcm: PcmAudio, start: float, end: float) -> float:
+    """Timestamp of the lowest-energy frame between start and end"""
+    samples = pcm.view(start, end).astype(np.float32)
+    frame = int(SILENCE_FRAME_SECONDS * pcm.sample_rate)
+    frames = len(samples) // frame
+    if frames == 0:
+        return end
+
+    energy = np.square(samples[:frames * frame].reshape(frames, frame)).mean(axis=1)
+    return start + (int(np.argmin(energy)) + 0.5) * SILENCE_FRAME_SECONDS
+
+def split_span(pcm: PcmAudio, start: float, end: float, max_duration: float,
+               search_seconds: float = 10.0, first_duration: float = None) -> List[Tuple[float, float]]:
+    """Split start..end into windows of at most max_duration seconds,
+    cutting at the quietest point within search_seconds of each boundary
+
+    first_duration, if given, caps the first window instead, so its text is
+    ready sooner.
+    """
+    windows = []
+
+    while start < end:
+        size = first_duration if first_duration and not windows else max_duration
+        limit = start + size
+        if limit >= end:
+            windows.append((start, end))
+            break
+
+        # Only the search region is read, so this stays cheap on long recordings
+        search = min(search_seconds, size / 2)
+        cut = quietest_point(pcm, limit - search, limit)
+        windows.append((start, cut))
+        start = cut
+
+    return windows
+
+def split_on_silence(pcm: PcmAudio, max_duration: float, search_seconds: float = 10.0,
+                     first_duration: float = None) -> List[Tuple[float, float]]:
+    """Split a whole recording into (start, end) windows at quiet points"""
+    return split_span(pcm, 0.0, pcm.duration, max_duration, search_seconds, first_duration)
+
+def _frame_energies_db(pcm: PcmAudio) -> np.ndarray:
+    """Per-frame energy in dB, computed block by block over the memory map"""
+    frame = int(VAD_FRAME_SECONDS * pcm.sample_rate)
+    block = frame * VAD_BLOCK_FRAMES
+    energies = []
+
+    for offset in range(0, len(pcm.samples), block):
+        samples = pcm.samples[offset:offset + block].astype(np.float32)
+        frames = len(samples) // frame
+        if frames:
+            power = np.square(samples[:frames * frame].reshape(frames, frame)).mean(axis=1)
+            energies.append(10 * np.log10(power + 1e-10))
+
+    return np.concatenate(energies) if energies else np.zeros(0, dtype=np.float32)
+
+def detect_speech(pcm: PcmAudio) -> List[Tuple[float, float]]:
+    """Find (start, end) regions containing speech using an adaptive energy threshold"""
+    energies = _frame_energies_db(pcm)
+    if not len(energies):
+        return []
+
+    # Frames well above the recording's own noise floor count as speech
+    noise_floor = np.percentile(energies, 10)
+    voiced = energies > noise_floor + settings.VAD_THRESHOLD_DB
+
+    # Locate runs of voiced frames
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1) * VAD_FRAME_SECONDS
+    ends = np.flatnonzero(edges == -1) * VAD_FRAME_SECONDS
+
+    regions = []
+    for start, end in zip(starts, ends):
+        start = max(0.0, start - settings.VAD_PAD_SECONDS)
+        end = min(pcm.duration, end + settings.VAD_PAD_SECONDS)
+
+        # Short pauses stay inside a region so words aren't clipped
+        if regions and start - regions[-1][1] < settings.VAD_MIN_SILENCE_SECONDS:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+
+    return [(float(start), float(end)) for start, end in regions if end - start >= settings.VAD_MIN_SPEECH_SECONDS]
+
+def pack_regions(pcm: PcmAudio, regions: List[Tuple[float, float]], max_duration: float,
+                 first_duration: float = None) -> List[List[Tuple[float, float]]]:
+    """Group speech regions into windows holding at most max_duration seconds of audio
+
+    first_duration, if given, caps the speech in the first window instead.
+    """
+    first_duration = first_duration or max_duration
+    windows = []
+    current = []
+    total = 0.0
+
+    for region_start, region_end in regions:
+        # Until the first window closes, split regions to fit what it has left
+        first_piece = max(first_duration - total, 1.0) if not windows else None
+        for start, end in split_span(pcm, region_start, region_end, max_duration, first_duration=first_piece):
+            budget = first_duration if not windows else max_duration
+            if current and total + (end - start) > budget:
+                windows.append(current)
+                current = []
+                total = 0.0
+            current.append((start, end))
+            total += end - start
+
+    if current:
+        windows.append(current)
+    return windows
+
+class PcmWriter:
+    """Appends raw int16 mono samples to a PCM cache file, filling in the header on close"""
+
+    def __init__(self, path: str, sample_rate: int = SAMPLE_RATE):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.num_bytes = 0
+        self._file = open(path, "wb")
+        self._file.write(PCM_HEADER.pack(PCM_MAGIC, PCM_VERSION, 1, sample_rate, 0))
+
+    def write(self, data: bytes):
+        self._file.write(data)
+        self.num_bytes += len(data)
+
+    @property
+    def duration(self) -> float:
+        return self.num_bytes / 2 / self.sample_rate
+
+    def close(self):
+        if self._file.closed:
+            return
+        # Fill in the sample count now that the stream length is known
+        self._file.seek(0)
+        self._file.write(PCM_HEADER.pack(PCM_MAGIC, PCM_VERSION, 1, self.sample_rate, self.num_bytes // 2))
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def decode_to_pcm_cache(file_path: str, cache_path: str,
+                        on_progress: Optional[Callable[[float], None]] = None) -> str:
+    """Stream-decode a file into a PCM cache without holding the waveform in memory
+
+    on_progress, if given, is called with the seconds of audio decoded so far.
+    """
+    if os.path.exists(cache_path):
+        return cache_path
+
+    tmp_path = cache_path + ".tmp"
+    process = subprocess.Popen(
+        _ffmpeg_decode_command(file_path),
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+
+    writer = PcmWriter(tmp_path)
+    try:
+        while True:
+            chunk = process.stdout.read(PCM_READ_CHUNK)
+            if not chunk:
+                break
+            writer.write(chunk)
+            if on_progress:
+                on_progress(writer.duration)
+
+        if process.wait() != 0:
+            raise RuntimeError(f"Failed to decode audio: {file_path}")
+        writer.close()
+    except BaseException:
+        process.kill()
+        writer.abort()
+        raise
+
+    # Publish atomically so a crashed decode never leaves a truncated cache
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+def pcm_cache_path(file_path: str) -> str:
+    """Location of the PCM cache for an uploaded file"""
+    return os.path.splitext(file_path)[0] + ".pcm"
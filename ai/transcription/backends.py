@@ -0,0 +1,212 @@
+import io
+import wave
+import threading
+from collections import OrderedDict
+import numpy as np
+import requests
+from app.core.config import settings
+from ai.transcription.audio import SAMPLE_RATE
+
+class TranscriptionBackend:
+    """Speech-to-text engine that transcribes one 16 kHz mono float32 window
+
+    Implementations return a dict shaped like openai-whisper's transcribe():
+    {"text": str, "segments": [{"id", "start", "end", "text", ...}], "language": str}
+    with timestamps relative to the start of the window.
+    """
+
+    def transcribe_array(self, audio: np.ndarray, model_name: str = None) -> dict:
+        raise NotImplementedError
+
+# Approximate fp32 weight sizes, used to budget a model before it is loaded
+MODEL_SIZES_MB = {
+    "tiny": 75, "base": 145, "small": 485,
+    "medium": 1530, "large": 3090
+}
+
+class ModelPool:
+    """Resident models keyed by name, evicted least-recently-used to stay within a memory budget
+
+    Each name may hold up to max_replicas copies so concurrent windows can
+    decode in parallel. Only idle replicas are evicted; the first replica of
+    a requested model is always loaded, even over budget.
+    """
+
+    def __init__(self, load, budget_bytes: int, max_replicas: int = 1):
+        self._load = load
+        self._budget = budget_bytes
+        self._max_replicas = max_replicas
+        self._entries = OrderedDict()  # name -> {"idle": [...], "total": int, "bytes": int}
+        self._cond = threading.Condition()
+
+    def _resident_bytes(self) -> int:
+        return sum(entry["bytes"] * entry["total"] for entry in self._entries.values())
+
+    def _evict_for(self, needed: int, keep: str):
+        # OrderedDict iterates least recently used first
+        for name in list(self._entries):
+            if self._resident_bytes() + needed <= self._budget:
+                return
+            if name == keep:
+                continue
+            entry = self._entries[name]
+            while entry["idle"] and self._resident_bytes() + needed > self._budget:
+                entry["idle"].pop()
+                entry["total"] -= 1
+                print(f"Evicted whisper model replica: {name}")
+            if entry["total"] == 0:
+                del self._entries[name]
+
+    def acquire(self, name: str):
+        with self._cond:
+            while True:
+                entry = self._entries.get(name)
+                if entry is None:
+                    entry = {"idle": [], "total": 0, "bytes": MODEL_SIZES_MB.get(name, 1024) * 1024 * 1024}
+                    self._entries[name] = entry
+                self._entries.move_to_end(name)
+
+                if entry["idle"]:
+                    return entry["idle"].pop()
+
+                if entry["total"] < self._max_replicas:
+                    self._evict_for(entry["bytes"], keep=name)
+                    if entry["total"] == 0 or self._resident_bytes() + entry["bytes"] <= self._budget:
+                        # Reserve the slot, then load outside the lock
+                        entry["total"] += 1
+                        break
+
+                self._cond.wait()
+
+        try:
+            model = self._load(name)
+        except BaseException:
+            with self._cond:
+                entry["total"] -= 1
+                if entry["total"] == 0 and not entry["idle"]:
+                    self._entries.pop(name, None)
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            entry["bytes"] = sum(p.numel() * p.element_size() for p in model.parameters())
+        return model
+
+    def release(self, name: str, model):
+        with self._cond:
+            entry = self._entries[name]
+            if self._resident_bytes() > self._budget and entry["total"] > 1:
+                # Another model was loaded over budget meanwhile; shed this copy
+                entry["total"] -= 1
+            else:
+                entry["idle"].append(model)
+            self._cond.notify_all()
+
+class TorchWhisperBackend(TranscriptionBackend):
+    """openai-whisper running in-process on PyTorch"""
+
+    def __init__(self, default_model: str, budget_bytes: int, replicas: int = 1):
+        import torch
+        import whisper
+        self._whisper = whisper
+
+        # Check if CUDA is available for faster processing
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        print(f"Using device: {self.device}")
+
+        # Whisper installs kv-cache hooks on the model while decoding, so each
+        # concurrently decoding worker needs its own model replica
+        self.default_model = default_model
+        self.models = ModelPool(self._load_model, budget_bytes, max_replicas=replicas)
+
+        # Keep the default model resident from the start
+        self.models.release(default_model, self.models.acquire(default_model))
+
+    def _load_model(self, name: str):
+        print(f"Loading whisper model: {name}")
+        return self._whisper.load_model(name, device=self.device)
+
+    def transcribe_array(self, audio: np.ndarray, model_name: str = None) -> dict:
+        model_name = model_name or self.default_model
+        model = self.models.acquire(model_name)
+        try:
+            result = model.transcribe(
+                audio,
+                fp16=False,  # Use float32 instead of float16 for CPU compatibility
+                language="en"  # Specify language if known, or remove for auto-detection
+            )
+        finally:
+            self.models.release(model_name, model)
+
+        return {
+            "text": result["text"],
+            "segments": result["segments"],
+            "language": result["language"]
+        }
+
+class WhisperCppBackend(TranscriptionBackend):
+    """whisper.cpp `server` example, which keeps its ggml model loaded between requests"""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/") + "/inference"
+        # Keep-alive connections to the long-running server
+        self.session = requests.Session()
+
+    @staticmethod
+    def _to_wav(audio: np.ndarray) -> bytes:
+        """Encode a float32 waveform as an in-memory 16-bit WAV"""
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(pcm.tobytes())
+        return buffer.getvalue()
+
+    def transcribe_array(self, audio: np.ndarray, model_name: str = None) -> dict:
+        # The server owns a single ggml model chosen at startup, so model_name is ignored
+        response = self.session.post(
+            self.url,
+            files={"file": ("audio.wav", self._to_wav(audio), "audio/wav")},
+            data={
+                "response_format": "verbose_json",
+                "language": "en",
+                "temperature": "0.0"
+            },
+            timeout=settings.WHISPER_CPP_TIMEOUT
+        )
+        response.raise_for_status()
+        result = response.json()
+        if "error" in result:
+            raise RuntimeError(f"whisper.cpp error: {result['error']}")
+
+        segments = [
+            {
+                "id": i,
+                "start": segment.get("start", 0.0),
+                "end": segment.get("end", 0.0),
+                "text": segment.get("text", ""),
+                "avg_logprob": segment.get("avg_logprob"),
+                "no_speech_prob": segment.get("no_speech_prob")
+            }
+            for i, segment in enumerate(result.get("segments", []))
+        ]
+
+        return {
+            "text": result.get("text", ""),
+            "segments": segments,
+            "language": "en"
+        }
+
+def create_backend(name: str) -> TranscriptionBackend:
+    """Build the transcription backend selected by settings.TRANSCRIPTION_BACKEND"""
+    if name == "torch":
+        return TorchWhisperBackend(
+            settings.WHISPER_MODEL,
+            budget_bytes=settings.WHISPER_MODEL_MEMORY,
+            replicas=settings.TRANSCRIBE_WORKERS
+        )
+    if name == "whispercpp":
+        return WhisperCppBackend(settings.WHISPER_CPP_URL)
+    raise ValueError(f"Unknown transcription backend: {name}")
@@ -0,0 +1,105 @@
+import numpy as np
+from typing import List, Tuple
+from ai.transcription.audio import SAMPLE_RATE
+
+class LiveWindow:
+    """Sliding window over a live PCM stream that commits stable segments
+
+    Audio arrives as raw s16le 16 kHz mono bytes. Each transcription pass
+    covers the audio since the last committed segment, up to window_seconds.
+    Segments ending more than holdback_seconds before the end of the window
+    are committed: Whisper rarely revises text that far back once more audio
+    arrives. Committed audio is dropped, so memory is bounded by the window
+    and max_buffer_seconds, not call length. If transcription falls behind
+    by more than max_buffer_seconds, the oldest pending audio is skipped and
+    counted in dropped_seconds.
+    """
+
+    def __init__(self, window_seconds: float, holdback_seconds: float, max_buffer_seconds: float):
+        self.window_samples = int(window_seconds * SAMPLE_RATE)
+        self.holdback_samples = int(holdback_seconds * SAMPLE_RATE)
+        self.max_buffer_samples = max(int(max_buffer_seconds * SAMPLE_RATE), self.window_samples)
+        self._buffer = np.zeros(0, dtype=np.int16)
+        self._remainder = b""
+        # Stream position, in samples, of the first buffered sample
+        self._offset = 0
+        self._received = 0
+        self._attempted = 0
+        self.dropped_seconds = 0.0
+
+    @property
+    def received_seconds(self) -> float:
+        return self._received / SAMPLE_RATE
+
+    def append(self, data: bytes):
+        # Frames may split a sample; carry the odd byte to the next frame
+        data = self._remainder + data
+        usable = len(data) - len(data) % 2
+        self._remainder = data[usable:]
+        samples = np.frombuffer(data[:usable], dtype=np.int16)
+        self._buffer = np.concatenate([self._buffer, samples])
+        self._received += len(samples)
+
+        overflow = len(self._buffer) - self.max_buffer_samples
+        if overflow > 0:
+            self._buffer = self._buffer[overflow:]
+            self._offset += overflow
+            self.dropped_seconds += overflow / SAMPLE_RATE
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Audio received but not yet committed or skipped"""
+        return len(self._buffer) / SAMPLE_RATE
+
+    def is_last_window(self) -> bool:
+        return len(self._buffer) <= self.window_samples
+
+    def pending_seconds(self) -> float:
+        """Audio received since the last transcription pass"""
+        return (self._received - max(self._attempted, self._offset)) / SAMPLE_RATE
+
+    def window(self) -> Tuple[float, np.ndarray]:
+        """Start time and float32 waveform of the next pass"""
+        samples = self._buffer[:self.window_samples]
+        self._attempted = self._offset + len(samples)
+        return self._offset / SAMPLE_RATE, samples.astype(np.float32) / 32768.0
+
+    def commit(self, start: float, duration: float, result: dict, final: bool = False) -> List[dict]:
+        """Commit the stable segments of a pass over the window at start
+
+        Returns them on the stream's timeline and drops their audio. With
+        final, everything transcribed is committed.
+        """
+        full = duration * SAMPLE_RATE >= self.window_samples
+        stable_until = start + duration - self.holdback_samples / SAMPLE_RATE
+        segments = [s for s in result.get("segments", []) if s.get("text", "").strip()]
+
+        if final:
+            committed = segments
+        elif full:
+            # A full window has to move on; keep only the last segment, which may be cut off
+            committed = segments[:-1] or segments
+        else:
+            committed = [s for s in segments if start + s["end"] <= stable_until]
+
+        if final:
+            cut = start + duration
+        elif committed:
+            cut = start + committed[-1]["end"]
+        elif full or (not segments and duration * SAMPLE_RATE > self.holdback_samples):
+            # Nothing usable, e.g. silence: skip all but the tail the next pass may need
+            cut = stable_until
+        else:
+            cut = start
+        self._drop_until(cut)
+
+        return [
+            dict(segment, start=start + segment["start"], end=start + segment["end"])
+            for segment in committed
+        ]
+
+    def _drop_until(self, seconds: float):
+        samples = min(max(int(seconds * SAMPLE_RATE) - self._offset, 0), len(self._buffer))
+        if samples:
+            self._buffer = self._buffer[samples:].copy()
+            self._offset += samples
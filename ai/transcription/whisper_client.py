@@ -1,64 +1,216 @@
 import os
-import whisper
-import torch
-from pydub import AudioSegment
+import re
+import threading
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple, Union
 from app.core.config import settings
+from ai.transcription.audio import decode_audio, split_on_silence, detect_speech, pack_regions, PcmAudio
+from ai.transcription.backends import create_backend
+
+# Longest run of repeated words removed when stitching adjacent windows
+MAX_BOUNDARY_WORDS = 8
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+def _drop_repeated_prefix(previous_words: List[str], text: str) -> str:
+    """Remove leading words of text that repeat the tail of the previous window"""
+    words = text.split()
+    tail = [_normalize_word(w) for w in previous_words[-MAX_BOUNDARY_WORDS:]]
+    head = [_normalize_word(w) for w in words[:MAX_BOUNDARY_WORDS]]
+    
+    for size in range(min(len(tail), len(head)), 0, -1):
+        if tail[-size:] == head[:size]:
+            return " ".join(words[size:])
+    return text
+
+def map_to_timeline(spans: List[Tuple[float, float]], t: float) -> float:
+    """Map a time within spans joined back to back onto the original recording"""
+    offset = 0.0
+    for start, end in spans:
+        if t < offset + (end - start):
+            return start + (t - offset)
+        offset += end - start
+    return spans[-1][1]
+
+class WindowStitcher:
+    """Merges per-window Whisper results, in window order, into one transcript
+    on the original timeline
+
+    Each job is (spans, boundary): the recording spans decoded back to back
+    for that window, and the time before which audio was already covered by
+    the previous window (decoded only as overlap context). Windows can be
+    added as they finish, so finished text is available before the rest.
+    """
+    
+    def __init__(self):
+        self.segments = []
+        self.words = []
+        self.language = "en"
+    
+    def add(self, job: Tuple[List[Tuple[float, float]], float], result: dict) -> List[dict]:
+        """Stitch the next window's result; returns the segments it contributed"""
+        spans, boundary = job
+        self.language = result.get("language", self.language)
+        has_overlap = spans[0][0] < boundary
+        added = []
+        
+        for segment in result["segments"]:
+            start = map_to_timeline(spans, segment["start"])
+            end = map_to_timeline(spans, segment["end"])
+            
+            # Segments entirely inside the overlap were transcribed by the previous window
+            if has_overlap and end <= boundary:
+                continue
+            
+            text = segment["text"].strip()
+            if has_overlap and start < boundary:
+                text = _drop_repeated_prefix(self.words, text)
+            if not text:
+                continue
+            
+            added.append(dict(segment, id=len(self.segments) + len(added), start=max(start, boundary), end=end, text=" " + text))
+            self.words.extend(text.split())
+        
+        self.segments.extend(added)
+        return added
+    
+    def result(self) -> dict:
+        return {
+            "text": " ".join(self.words),
+            "segments": self.segments,
+            "language": self.language
+        }
 
 class WhisperTranscriber:
     def __init__(self):
-        # Check if CUDA is available for faster processing
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        print(f"Using device: {self.device}")
+        # Engine is chosen by config: in-process PyTorch whisper or a whisper.cpp server
+        self.backend = create_backend(settings.TRANSCRIPTION_BACKEND)
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.TRANSCRIBE_WORKERS,
+            thread_name_prefix="whisper"
+        )
+    
+    def _transcribe_array(self, audio: np.ndarray, model_name: str = None) -> dict:
+        return self.backend.transcribe_array(audio, model_name)
+    
+    def submit(self, audio: np.ndarray, model_name: str = None) -> Future:
+        """Queue one 16 kHz mono float32 clip on the transcription pool
+
+        Used by live ingest, which owns its windowing; failures surface on
+        the returned future.
+        """
+        return self._executor.submit(self._transcribe_array, audio, model_name)
+    
+    def _transcribe_pcm_spans(self, pcm: PcmAudio, spans: List[Tuple[float, float]], model_name: str = None) -> dict:
+        # Converted inside the worker so only in-flight windows exist as float32
+        return self._transcribe_array(pcm.gather(spans), model_name)
+    
+    def _plan_windows(self, pcm: PcmAudio) -> Tuple[list, float]:
+        """Build (spans, boundary) jobs for a recording and report its speech ratio"""
+        if settings.VAD_ENABLED:
+            # Only detected speech is decoded; regions are packed back to back
+            # into full windows since Whisper pads every call to 30 seconds.
+            # Cuts fall in silence, so these windows need no overlap.
+            regions = detect_speech(pcm)
+            speech = sum(end - start for start, end in regions)
+            windows = pack_regions(
+                pcm, regions, settings.TRANSCRIBE_WINDOW_SECONDS,
+                first_duration=settings.TRANSCRIBE_FIRST_WINDOW_SECONDS
+            )
+            jobs = [(spans, spans[0][0]) for spans in windows]
+            return jobs, (speech / pcm.duration if pcm.duration else 0.0)
         
-        # Load the model (you can choose different sizes: tiny, base, small, medium, large)
-        # For production, you might want to make this configurable
-        self.model = whisper.load_model("base", device=self.device)
+        # Each window after the first also decodes a little audio before its
+        # boundary, giving Whisper context for the first words of the window
+        overlap = settings.TRANSCRIBE_OVERLAP_SECONDS
+        windows = split_on_silence(
+            pcm, settings.TRANSCRIBE_WINDOW_SECONDS,
+            first_duration=settings.TRANSCRIBE_FIRST_WINDOW_SECONDS
+        )
+        jobs = [
+            ([(max(0.0, start - overlap) if i else start, end)], start)
+            for i, (start, end) in enumerate(windows)
+        ]
+        return jobs, 1.0
     
-    def convert_to_wav(self, file_path: str) -> str:
-        """Convert audio/video file to WAV format if needed"""
-        if file_path.endswith('.wav'):
-            return file_path
-            
-        # Convert to WAV
-        wav_path = file_path.replace('.' + file_path.split('.')[-1], '.wav')
+    def _transcribe_windows(self, pcm: PcmAudio, model_name: str = None,
+                            on_progress: Optional[Callable] = None,
+                            on_segments: Optional[Callable] = None) -> dict:
+        """Transcribe a memory-mapped recording in windows across the worker pool"""
+        jobs, speech_ratio = self._plan_windows(pcm)
+        print(f"Transcribing {len(jobs)} windows, speech ratio {speech_ratio:.2f} of {pcm.duration:.0f}s")
         
+        durations = [sum(end - start for start, end in spans) for spans, _ in jobs]
+        total_seconds = sum(durations)
+        if on_progress:
+            on_progress(0, len(jobs), 0.0, total_seconds)
+        
+        # Peak memory is bounded by window length times workers, not meeting length
+        futures = {
+            self._executor.submit(self._transcribe_pcm_spans, pcm, spans, model_name): i
+            for i, (spans, _) in enumerate(jobs)
+        }
+        # Windows may finish out of order; text is stitched and published as
+        # soon as every earlier window is done
+        finished = {}
+        stitcher = WindowStitcher()
+        stitched = 0
+        done_seconds = 0.0
         try:
-            # Handle different file formats
-            audio = AudioSegment.from_file(file_path)
-            audio.export(wav_path, format="wav")
-        except Exception as e:
-            print(f"Error converting file: {e}")
-            raise e
-            
-        return wav_path
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                finished[i] = future.result()
+                while stitched in finished:
+                    added = stitcher.add(jobs[stitched], finished.pop(stitched))
+                    stitched += 1
+                    if on_segments and added:
+                        on_segments(added)
+                done_seconds += durations[i]
+                if on_progress:
+                    on_progress(done, len(jobs), done_seconds, total_seconds)
+        except BaseException:
+            # The pool is shared: drop this recording's remaining windows so
+            # they don't hold up the retry and other meetings
+            for future in futures:
+                future.cancel()
+            raise
+        
+        result = stitcher.result()
+        result["speech_ratio"] = speech_ratio
+        return result
     
-    def transcribe(self, file_path: str) -> dict:
-        """Transcribe audio file using Whisper"""
-        try:
-            # Convert to WAV if needed
-            wav_path = self.convert_to_wav(file_path)
-            
-            # Transcribe the audio file
-            result = self.model.transcribe(
-                wav_path,
-                fp16=False,  # Use float32 instead of float16 for CPU compatibility
-                language="en"  # Specify language if known, or remove for auto-detection
-            )
-            
-            return {
-                "text": result["text"],
-                "segments": result["segments"],
-                "language": result["language"]
-            }
-            
-        except Exception as e:
-            print(f"Transcription error: {e}")
-            # Fallback for demo purposes
-            return {
-                "text": "This is a sample transcript from the meeting. Participants discussed various topics including project timelines, budget allocation, and team responsibilities. John mentioned that the marketing campaign needs to be completed by next Friday. Sarah will handle the client presentation. The team agreed to use the new software tool for project management.",
-                "segments": [],
-                "language": "en"
-            }
+    def transcribe(self, audio: Union[str, np.ndarray, PcmAudio], model_name: str = None,
+                   on_progress: Optional[Callable] = None,
+                   on_segments: Optional[Callable] = None) -> dict:
+        """Transcribe a file path, PCM cache or 16 kHz mono float32 waveform using Whisper
+
+        model_name picks one of settings.WHISPER_MODELS (e.g. "tiny" for previews);
+        defaults to settings.WHISPER_MODEL. For a PCM cache, on_progress is called
+        as (windows_done, windows_total, seconds_done, seconds_total) as windows finish,
+        and on_segments with each run of newly stitched segments, in transcript order.
+        Errors propagate, so the job queue can retry the meeting or mark it failed.
+        """
+        if isinstance(audio, PcmAudio):
+            return self._transcribe_windows(audio, model_name, on_progress, on_segments)
+        
+        # Decode once; Whisper skips its own ffmpeg pass for arrays
+        if isinstance(audio, str):
+            audio = decode_audio(audio)
+        
+        # Transcribe the audio
+        return self._transcribe_array(audio, model_name)
+
+# Global instance, created on first use so importing this module stays cheap
+_transcriber = None
+_transcriber_lock = threading.Lock()
 
-# Global instance
-transcriber = WhisperTranscriber()
\ No newline at end of file
+def get_transcriber() -> WhisperTranscriber:
+    """Return the shared transcriber, loading the model on first call"""
+    global _transcriber
+    if _transcriber is None:
+        with _transcriber_lock:
+            if _transcriber is None:
+                _transcriber = WhisperTranscriber()
+    return _transcriber
\ No newline at end of file
@@ -17,20 +17,129 @@ class MeetingResponse(MeetingBase):
     class Config:
         from_attributes = True
 
+class MeetingListResponse(BaseModel):
+    meetings: List[MeetingResponse]
+    next_cursor: Optional[str] = None
+
 class MeetingDetailsResponse(MeetingResponse):
     transcript: Optional[str] = None
     action_items: Optional[List[Dict[str, Any]]] = None
     decisions: Optional[List[Dict[str, Any]]] = None
     participants: Optional[List[Dict[str, Any]]] = None
     topics: Optional[List[str]] = None
+    speech_ratio: Optional[float] = None
+
+class ActionItemResponse(BaseModel):
+    id: int
+    meeting_id: str
+    assignee: Optional[str] = None
+    task: str
+    deadline: Optional[str] = None
+    status: str
+
+    class Config:
+        from_attributes = True
+
+class ActionItemListResponse(BaseModel):
+    action_items: List[ActionItemResponse]
+    next_cursor: Optional[int] = None
+
+class DecisionResponse(BaseModel):
+    id: int
+    meeting_id: str
+    decision: str
+    made_by: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class DecisionListResponse(BaseModel):
+    decisions: List[DecisionResponse]
+    next_cursor: Optional[int] = None
+
+class TopicCountResponse(BaseModel):
+    topic: str
+    meetings: int
+
+class NamedCount(BaseModel):
+    name: str
+    count: int
+
+class DailyMeetingCount(BaseModel):
+    day: str
+    completed: int
+    failed: int
+
+class AnalyticsResponse(BaseModel):
+    total_meetings: int
+    completed: int
+    processing: int
+    failed: int
+    total_audio_seconds: float
+    avg_processing_seconds: Optional[float] = None
+    meetings_per_day: List[DailyMeetingCount]
+    action_items_by_assignee: List[NamedCount]
+    topics: List[NamedCount]
+
+class TranscriptSegmentResponse(BaseModel):
+    position: int
+    start: float
+    end: float
+    text: str
+    avg_logprob: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+class TranscriptPageResponse(BaseModel):
+    meeting_id: str
+    segments: List[TranscriptSegmentResponse]
+    next_cursor: Optional[int] = None
 
 class UploadResponse(BaseModel):
     meeting_id: str
     status: str
 
+class CreateUploadRequest(BaseModel):
+    filename: str
+    size: int
+    part_size: Optional[int] = None
+    whisper_model: Optional[str] = None
+
+class UploadSessionResponse(BaseModel):
+    upload_id: str
+    filename: str
+    size: int
+    part_size: int
+    total_parts: int
+    received_parts: List[int] = []
+
+class UploadPartResponse(BaseModel):
+    upload_id: str
+    part_number: int
+    size: int
+
 class StatusResponse(BaseModel):
     status: str
     progress: int
+    stage: Optional[str] = None
+    phase: Optional[str] = None
+    audio_seconds: Optional[float] = None
+    decoded_seconds: Optional[float] = None
+    windows_done: Optional[int] = None
+    windows_total: Optional[int] = None
+    real_time_factor: Optional[float] = None
+    eta_seconds: Optional[float] = None
+
+class StageQueueStats(BaseModel):
+    queued: int = 0
+    running: int = 0
+
+class QueueStatsResponse(BaseModel):
+    stages: Dict[str, StageQueueStats]
+    pending_audio_seconds: float
+    real_time_factor: Optional[float] = None
+    estimated_seconds: Optional[float] = None
 
 class SearchRequest(BaseModel):
     query: str
@@ -1,98 +1,490 @@
+import os
 import uuid
+import json
 import asyncio
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import (
+    APIRouter, Depends, HTTPException, Request, Query,
+    WebSocket, WebSocketDisconnect
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import undefer, undefer_group
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, init_db
 from app.models.meeting import Meeting
 from app.api.models import (
     MeetingCreate, MeetingResponse, MeetingDetailsResponse,
-    UploadResponse, StatusResponse, SearchRequest, SearchResponse
+    UploadResponse, StatusResponse, SearchRequest, SearchResponse,
+    CreateUploadRequest, UploadSessionResponse, UploadPartResponse,
+    QueueStatsResponse, MeetingListResponse, ActionItemListResponse,
+    DecisionListResponse, TopicCountResponse, AnalyticsResponse, TranscriptPageResponse
+)
+from app.services.file_service import (
+    save_multipart_upload, FileTooLargeError, InvalidUploadError
+)
+from app.services.upload_service import (
+    create_upload_session, get_upload_session, write_upload_part, complete_upload_session,
+    remove_upload_session, UploadSessionNotFoundError, InvalidUploadPartError, UploadSessionCompletingError
+)
+from app.services.job_queue import enqueue_job, count_by_stage
+from app.services.status_broker import status_broker
+from app.services.live_service import LiveSession
+from app.services.meeting_service import list_meetings_page, InvalidCursorError
+from app.services.analytics_service import get_analytics
+from app.services.segment_service import list_transcript_segments
+from app.services.insight_service import (
+    find_action_items, find_decisions, topic_counts,
+    meetings_for_topic, meetings_for_participant
+)
+from app.services.progress_service import (
+    meeting_status_payload, transcription_backlog, STAGE_WEIGHTS
 )
-from app.services.file_service import save_uploaded_file, is_video_file, extract_audio_from_video
-from app.services.transcription_service import process_transcription
-from app.services.extraction_service import process_extraction
-from app.services.search_service import store_meeting_vectors
 
 router = APIRouter()
 
-@router.post("/upload", response_model=UploadResponse)
-async def upload_file(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db)
-):
-    """Upload meeting recording file"""
+@router.on_event("startup")
+async def create_tables():
+    """Make sure the meeting and job tables exist"""
+    init_db()
+
+@router.on_event("startup")
+async def warmup_ai_clients():
+    """Optionally load the Whisper model and connect to Chroma before the first request"""
+    if not settings.WARMUP_ON_STARTUP:
+        return
+    
+    from ai.transcription.whisper_client import get_transcriber
+    from ai.search.chroma_client import get_search_client
+    
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, get_transcriber)
+    await loop.run_in_executor(None, get_search_client)
+
+@router.post("/upload", response_model=UploadResponse, openapi_extra={
+    "requestBody": {"required": True, "content": {"multipart/form-data": {"schema": {
+        "type": "object",
+        "required": ["file"],
+        "properties": {
+            "file": {"type": "string", "format": "binary"},
+            "whisper_model": {"type": "string"}
+        }
+    }}}}
+})
+async def upload_file(request: Request, db: AsyncSession = Depends(get_db)):
+    """Upload meeting recording file
+
+    The form is parsed from the request stream instead of File(...), which
+    would spool the whole body to a temp file before size checks could run.
+    """
     meeting_id = str(uuid.uuid4())
     
     # Save file
-    file_path = save_uploaded_file(file, meeting_id)
+    try:
+        file_path, filename, fields = await save_multipart_upload(request, meeting_id)
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except InvalidUploadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    whisper_model = fields.get("whisper_model") or None
+    try:
+        validate_whisper_model(whisper_model)
+    except HTTPException:
+        os.remove(file_path)
+        raise
+    
+    return await start_meeting_processing(meeting_id, filename, file_path, db, whisper_model)
+
+@router.post("/uploads", response_model=UploadSessionResponse)
+async def create_upload(upload: CreateUploadRequest):
+    """Start a resumable multipart upload"""
+    validate_whisper_model(upload.whisper_model)
+    loop = asyncio.get_event_loop()
+    try:
+        # Session files are written in the executor, off the event loop
+        session = await loop.run_in_executor(
+            None, create_upload_session,
+            upload.filename, upload.size, upload.part_size, upload.whisper_model
+        )
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (InvalidUploadError, InvalidUploadPartError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return UploadSessionResponse(**session, received_parts=[])
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload(upload_id: str):
+    """Get resumable upload state, including parts already received"""
+    try:
+        session = await asyncio.get_event_loop().run_in_executor(None, get_upload_session, upload_id)
+    except UploadSessionNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    except UploadSessionCompletingError:
+        raise HTTPException(status_code=409, detail="Upload is being completed")
+    
+    return UploadSessionResponse(**session)
+
+@router.put("/uploads/{upload_id}/parts/{part_number}", response_model=UploadPartResponse)
+async def upload_part(upload_id: str, part_number: int, request: Request):
+    """Upload one byte range of a resumable upload; parts may be sent in parallel"""
+    try:
+        size = await write_upload_part(upload_id, part_number, request.stream())
+    except UploadSessionNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    except UploadSessionCompletingError:
+        raise HTTPException(status_code=409, detail="Upload is being completed")
+    except InvalidUploadPartError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # If video, extract audio
-    if is_video_file(file_path):
-        file_path = extract_audio_from_video(file_path)
+    return UploadPartResponse(upload_id=upload_id, part_number=part_number, size=size)
+
+@router.post("/uploads/{upload_id}/complete", response_model=UploadResponse)
+async def complete_upload(
+    upload_id: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """Finalize a resumable upload and start processing"""
+    loop = asyncio.get_event_loop()
+    try:
+        session = await loop.run_in_executor(None, get_upload_session, upload_id)
+        file_path = await loop.run_in_executor(None, complete_upload_session, upload_id)
+    except UploadSessionNotFoundError:
+        # A retried complete after success finds the meeting instead of the session
+        status = await db.scalar(select(Meeting.status).where(Meeting.meeting_id == upload_id))
+        if status is None:
+            raise HTTPException(status_code=404, detail="Upload not found")
+        return UploadResponse(meeting_id=upload_id, status=status)
+    except UploadSessionCompletingError:
+        raise HTTPException(status_code=409, detail="Upload is being completed")
+    except (InvalidUploadError, InvalidUploadPartError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
+    response = await start_meeting_processing(
+        upload_id, session["filename"], file_path, db, session.get("whisper_model")
+    )
+    # Until now concurrent completes get 409; from here on they find the meeting
+    await loop.run_in_executor(None, remove_upload_session, upload_id)
+    return response
+
+def validate_whisper_model(whisper_model: Optional[str]):
+    """Reject transcription model names that aren't enabled in settings"""
+    if whisper_model and whisper_model not in settings.WHISPER_MODELS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown whisper model '{whisper_model}', expected one of {settings.WHISPER_MODELS}"
+        )
+
+async def start_meeting_processing(
+    meeting_id: str,
+    filename: str,
+    file_path: str,
+    db: AsyncSession,
+    whisper_model: Optional[str] = None
+) -> UploadResponse:
+    """Create the meeting record for a saved upload and kick off processing"""
     # Create meeting record
     meeting = Meeting(
         meeting_id=meeting_id,
-        filename=file.filename,
-        status="processing"
+        filename=filename,
+        status="processing",
+        file_path=file_path,
+        whisper_model=whisper_model
     )
     db.add(meeting)
-    db.commit()
-    db.refresh(meeting)
     
-    # Start background processing
-    asyncio.create_task(process_meeting(meeting_id, file_path, db))
+    # Queue background processing in the same transaction, so a meeting is
+    # never recorded without its job; worker processes pick it up
+    await db.run_sync(enqueue_job, meeting_id, "transcribe", {"file_path": file_path})
+    await db.commit()
     
     return UploadResponse(meeting_id=meeting_id, status="processing")
 
+@router.websocket("/meetings/live")
+async def ingest_live_meeting(
+    websocket: WebSocket,
+    filename: str = "live-meeting",
+    whisper_model: Optional[str] = None
+):
+    """Transcribe a meeting while it happens
+
+    The client streams binary frames of s16le 16 kHz mono PCM and sends the
+    text "stop" (or closes the socket) when the call ends. Committed segments
+    are stored on the meeting and echoed back as they become stable; the
+    meeting then continues through extraction like an upload.
+    """
+    if whisper_model and whisper_model not in settings.WHISPER_MODELS:
+        await websocket.close(code=1008, reason=f"Unknown whisper model '{whisper_model}'")
+        return
+    
+    await websocket.accept()
+    session = LiveSession(str(uuid.uuid4()), filename, whisper_model)
+    await session.start()
+    await websocket.send_json({"type": "started", "meeting_id": session.meeting_id})
+    
+    connected = True
+    
+    async def receive_frames():
+        nonlocal connected
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    connected = False
+                    break
+                if message.get("bytes"):
+                    await session.feed(message["bytes"])
+                elif message.get("text") == "stop":
+                    break
+        finally:
+            session.stop()
+    
+    async def send(message: dict):
+        nonlocal connected
+        if not connected:
+            return
+        try:
+            await websocket.send_json(message)
+        except (WebSocketDisconnect, RuntimeError):
+            connected = False
+    
+    async def send_segments(segments: List[dict]):
+        await send({"type": "segments", "segments": [
+            {"position": s["id"], "start": s["start"], "end": s["end"], "text": s["text"].strip()}
+            for s in segments
+        ]})
+    
+    receiver = asyncio.create_task(receive_frames())
+    try:
+        await session.run(send_segments)
+    finally:
+        receiver.cancel()
+        status = await session.finish()
+    
+    await send({"type": "completed", "meeting_id": session.meeting_id, "status": status})
+    if connected:
+        await websocket.close()
+
 @router.get("/meetings/{meeting_id}/status", response_model=StatusResponse)
 async def get_meeting_status(
     meeting_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get meeting processing status"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
-    if not meeting:
+    payload = await db.run_sync(meeting_status_payload, meeting_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    # In a real implementation, you'd track actual progress
-    progress = 100 if meeting.status == "completed" else 50 if meeting.status == "processing" else 0
-    
-    return StatusResponse(status=meeting.status, progress=progress)
+    return StatusResponse(**payload)
+
+async def status_events(request: Request, meeting_ids: List[str]):
+    """Server-sent events for the given meetings, fed by the shared status broker"""
+    queue = status_broker.subscribe(meeting_ids)
+    try:
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(queue.get(), settings.STATUS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: status\ndata: {json.dumps(event)}\n\n"
+    finally:
+        status_broker.unsubscribe(queue)
+
+def event_stream(request: Request, meeting_ids: List[str]) -> StreamingResponse:
+    return StreamingResponse(
+        status_events(request, meeting_ids),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/meetings/status/stream")
+async def stream_meetings_status(request: Request, meeting_ids: List[str] = Query(...)):
+    """Stream status and progress events for several meetings over one connection"""
+    return event_stream(request, meeting_ids)
+
+@router.get("/meetings/{meeting_id}/status/stream")
+async def stream_meeting_status(meeting_id: str, request: Request):
+    """Stream status and progress events for one meeting instead of polling /status"""
+    return event_stream(request, [meeting_id])
+
+@router.get("/queue", response_model=QueueStatsResponse)
+async def get_queue_stats(db: AsyncSession = Depends(get_db)):
+    """Processing backlog per stage, for dashboards and worker autoscaling"""
+    counts = await db.run_sync(count_by_stage)
+    return QueueStatsResponse(
+        stages={stage: counts.get(stage, {}) for stage in STAGE_WEIGHTS},
+        **await db.run_sync(transcription_backlog)
+    )
 
 @router.get("/meetings/{meeting_id}", response_model=MeetingDetailsResponse)
 async def get_meeting_details(
     meeting_id: str,
-    db: Session = Depends(get_db)
+    include_transcript: bool = True,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get meeting details and insights"""
-    meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
+    """Get meeting details and insights
+
+    Pass include_transcript=false to skip the full transcript text and page
+    through /meetings/{meeting_id}/transcript instead.
+    """
+    options = [undefer_group("content")] if include_transcript else [
+        undefer(Meeting.action_items), undefer(Meeting.decisions),
+        undefer(Meeting.participants), undefer(Meeting.topics)
+    ]
+    meeting = await db.scalar(
+        select(Meeting).options(*options).where(Meeting.meeting_id == meeting_id)
+    )
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    return meeting
+    # Built field by field: touching an unloaded transcript would lazy-load it
+    return MeetingDetailsResponse(**{
+        name: getattr(meeting, name)
+        for name in MeetingDetailsResponse.model_fields
+        if include_transcript or name != "transcript"
+    })
+
+@router.get("/meetings/{meeting_id}/transcript", response_model=TranscriptPageResponse)
+async def get_meeting_transcript(
+    meeting_id: str,
+    limit: int = Query(200, ge=1, le=2000),
+    cursor: Optional[int] = None,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    wait: float = Query(0, ge=0, le=60),
+    db: AsyncSession = Depends(get_db)
+):
+    """Timestamped transcript segments a page at a time, optionally limited to start..end seconds
+
+    Segments appear while the meeting is still transcribing. With wait > 0 and
+    nothing new after cursor, the request long-polls up to wait seconds for more.
+    """
+    # Subscribe before reading so segments published in between aren't missed
+    updates = status_broker.subscribe([meeting_id]) if wait else None
+    try:
+        segments, next_cursor = await db.run_sync(
+            list_transcript_segments, meeting_id, limit, cursor, start, end
+        )
+        if not segments and updates is not None:
+            # Release the connection (and its read snapshot) while waiting, and
+            # re-read only when the shared status stream reports progress
+            # rather than each waiting client querying on a timer
+            await db.rollback()
+            await status_broker.next_change(updates, wait)
+            segments, next_cursor = await db.run_sync(
+                list_transcript_segments, meeting_id, limit, cursor, start, end
+            )
+    finally:
+        if updates is not None:
+            status_broker.unsubscribe(updates)
+    if not segments and cursor is None:
+        exists = await db.scalar(select(Meeting.id).where(Meeting.meeting_id == meeting_id))
+        if not exists:
+            raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    return TranscriptPageResponse(meeting_id=meeting_id, segments=segments, next_cursor=next_cursor)
 
-@router.get("/meetings", response_model=List[MeetingResponse])
+@router.get("/meetings", response_model=MeetingListResponse)
 async def list_meetings(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """List meetings newest first; pass next_cursor back as cursor for the following page"""
+    try:
+        meetings, next_cursor = await db.run_sync(
+            list_meetings_page, limit, cursor, status, created_after, created_before
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return MeetingListResponse(meetings=meetings, next_cursor=next_cursor)
+
+@router.get("/action-items", response_model=ActionItemListResponse)
+async def list_action_items(
+    assignee: Optional[str] = None,
+    status: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    """List all meetings"""
-    meetings = db.query(Meeting).offset(skip).limit(limit).all()
-    return meetings
+    """Action items across all meetings; assignee matches by name prefix, case-insensitively"""
+    items, next_cursor = await db.run_sync(find_action_items, assignee, status, meeting_id, limit, cursor)
+    return ActionItemListResponse(action_items=items, next_cursor=next_cursor)
+
+@router.get("/decisions", response_model=DecisionListResponse)
+async def list_decisions(
+    made_by: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Decisions across all meetings"""
+    decisions, next_cursor = await db.run_sync(find_decisions, made_by, meeting_id, limit, cursor)
+    return DecisionListResponse(decisions=decisions, next_cursor=next_cursor)
+
+@router.get("/topics", response_model=List[TopicCountResponse])
+async def list_topics(
+    prefix: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Most discussed topics with the number of meetings covering each"""
+    return [
+        TopicCountResponse(topic=topic, meetings=meetings)
+        for topic, meetings in await db.run_sync(topic_counts, prefix, limit)
+    ]
+
+@router.get("/topics/{topic}/meetings", response_model=List[MeetingResponse])
+async def list_topic_meetings(
+    topic: str,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Meetings that discussed a topic"""
+    return await db.run_sync(meetings_for_topic, topic, limit)
+
+@router.get("/participants/{name}/meetings", response_model=List[MeetingResponse])
+async def list_participant_meetings(
+    name: str,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    """Meetings a person took part in"""
+    return await db.run_sync(meetings_for_participant, name, limit)
+
+@router.get("/analytics", response_model=AnalyticsResponse)
+async def get_dashboard_analytics(
+    days: int = Query(30, ge=1, le=366),
+    top: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Dashboard figures from pre-aggregated tables, independent of archive size"""
+    return AnalyticsResponse(**await db.run_sync(get_analytics, days, top))
 
 @router.post("/search", response_model=SearchResponse)
 async def search_meetings(
     search_request: SearchRequest
 ):
     """Search meeting content"""
-    from ai.search.chroma_client import search_client
-    results = search_client.search(
-        query=search_request.query,
-        meeting_id=search_request.meeting_id
+    from ai.search.chroma_client import get_search_client
+    loop = asyncio.get_event_loop()
+    # The first call imports chromadb and connects, and queries are blocking
+    # HTTP calls; both run in the executor so other requests aren't stalled
+    client = await loop.run_in_executor(None, get_search_client)
+    results = await loop.run_in_executor(
+        None, lambda: client.search(query=search_request.query, meeting_id=search_request.meeting_id)
     )
     
     return SearchResponse(results=[
@@ -104,39 +496,3 @@ async def search_meetings(
         }
         for i in range(len(results["documents"]))
     ])
-
-async def process_meeting(meeting_id: str, file_path: str, db: Session):
-    """Background task to process meeting"""
-    try:
-        # Update status
-        meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
-        if meeting:
-            meeting.status = "processing"
-            db.commit()
-        
-        # Transcription
-        transcript = await process_transcription(file_path)
-        
-        # Information extraction
-        insights = await process_extraction(transcript)
-        
-        # Update database
-        if meeting:
-            meeting.transcript = transcript
-            meeting.action_items = insights.get("action_items", [])
-            meeting.decisions = insights.get("decisions", [])
-            meeting.participants = insights.get("participants", [])
-            meeting.topics = insights.get("topics", [])
-            meeting.status = "completed"
-            db.commit()
-        
-        # Store in vector database
-        store_meeting_vectors(meeting_id, transcript)
-        
-    except Exception as e:
-        # Handle errors
-        print(f"Meeting processing error for {meeting_id}: {e}")
-        meeting = db.query(Meeting).filter(Meeting.meeting_id == meeting_id).first()
-        if meeting:
-            meeting.status = "failed"
-            db.commit()
\ No newline at end of file
@@ -5,11 +5,56 @@ load_dotenv()
 
 class Settings:
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./meeting_insights.db")
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", "")  # API handlers; defaults to DATABASE_URL with an async driver
     OLLAMA_API_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434")
+    LLM_MODEL = os.getenv("LLM_MODEL", "llama2")
+    LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "4"))  # concurrent LLM requests per worker process
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "300"))  # seconds per LLM request
+    EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "map_reduce")  # map_reduce, or single to send the whole transcript in one prompt
+    EXTRACT_CHUNK_CHARS = int(os.getenv("EXTRACT_CHUNK_CHARS", "6000"))  # transcript per prompt, sized to fit llama2's 4k-token context
     CHROMA_HOST = os.getenv("CHROMA_HOST", "localhost")
     CHROMA_PORT = int(os.getenv("CHROMA_PORT", "8000"))
     UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
     MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", "100")) * 1024 * 1024  # MB to bytes
+    UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", "1024")) * 1024  # KB to bytes
+    UPLOAD_PART_SIZE = int(os.getenv("UPLOAD_PART_SIZE", "8")) * 1024 * 1024  # MB to bytes, resumable uploads
+    UPLOAD_MIN_PART_SIZE = int(os.getenv("UPLOAD_MIN_PART_SIZE", "1024")) * 1024  # KB to bytes, smallest part a client may choose
+    UPLOAD_MAX_PARTS = int(os.getenv("UPLOAD_MAX_PARTS", "10000"))
+    UPLOAD_SESSION_TTL_SECONDS = int(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24")) * 3600  # idle resumable uploads are deleted after this
+    FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+    AUDIO_DECODE_WORKERS = int(os.getenv("AUDIO_DECODE_WORKERS", "2"))  # concurrent ffmpeg decode jobs
+    TRANSCRIBE_WINDOW_SECONDS = int(os.getenv("TRANSCRIBE_WINDOW_SECONDS", "300"))  # audio held in memory per transcription step
+    TRANSCRIBE_FIRST_WINDOW_SECONDS = int(os.getenv("TRANSCRIBE_FIRST_WINDOW_SECONDS", "30"))  # shorter first window so partial text appears quickly
+    TRANSCRIBE_OVERLAP_SECONDS = float(os.getenv("TRANSCRIBE_OVERLAP_SECONDS", "1.0"))  # context shared between adjacent windows
+    TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "1"))  # windows transcribed in parallel, one model copy each
+    LIVE_WINDOW_SECONDS = float(os.getenv("LIVE_WINDOW_SECONDS", "30"))  # longest audio re-transcribed per live pass
+    LIVE_STEP_SECONDS = float(os.getenv("LIVE_STEP_SECONDS", "2"))  # new audio needed before the next live pass
+    LIVE_HOLDBACK_SECONDS = float(os.getenv("LIVE_HOLDBACK_SECONDS", "3"))  # recent audio whose segments aren't committed yet
+    LIVE_MAX_BUFFER_SECONDS = float(os.getenv("LIVE_MAX_BUFFER_SECONDS", "120"))  # uncommitted audio kept when transcription falls behind
+    VAD_ENABLED = os.getenv("VAD_ENABLED", "true").lower() == "true"  # transcribe only detected speech
+    VAD_THRESHOLD_DB = float(os.getenv("VAD_THRESHOLD_DB", "12"))  # speech level above the noise floor
+    VAD_MIN_SILENCE_SECONDS = float(os.getenv("VAD_MIN_SILENCE_SECONDS", "0.5"))
+    VAD_MIN_SPEECH_SECONDS = float(os.getenv("VAD_MIN_SPEECH_SECONDS", "0.25"))
+    VAD_PAD_SECONDS = float(os.getenv("VAD_PAD_SECONDS", "0.2"))
+    TRANSCRIPTION_BACKEND = os.getenv("TRANSCRIPTION_BACKEND", "torch")  # torch, whispercpp
+    WHISPER_CPP_URL = os.getenv("WHISPER_CPP_URL", "http://localhost:8080")  # whisper.cpp server
+    WHISPER_CPP_TIMEOUT = int(os.getenv("WHISPER_CPP_TIMEOUT", "600"))  # seconds per window
+    WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() == "true"  # load AI clients at startup instead of first use
     WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")  # tiny, base, small, medium, large
+    WHISPER_MODELS = os.getenv("WHISPER_MODELS", "tiny,base,small,medium,large").split(",")  # selectable per request
+    WHISPER_MODEL_MEMORY = int(os.getenv("WHISPER_MODEL_MEMORY", "2048")) * 1024 * 1024  # MB to bytes, resident model budget
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))  # SQLite wait for a write lock
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_RETRY_BACKOFF_SECONDS = int(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "30"))  # doubled after each failed attempt
+    JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "120"))  # running jobs without a heartbeat this long are requeued
+    WORKER_POLL_SECONDS = float(os.getenv("WORKER_POLL_SECONDS", "1.0"))
+    WORKER_CONCURRENCY = os.getenv("WORKER_CONCURRENCY", "transcribe=1,extract=2,index=1")  # worker processes per stage
+    WORKER_JOBS_IN_FLIGHT = os.getenv("WORKER_JOBS_IN_FLIGHT", "extract=8")  # jobs each worker process runs at once per stage, default 1
+    PROGRESS_UPDATE_SECONDS = float(os.getenv("PROGRESS_UPDATE_SECONDS", "2.0"))  # minimum interval between progress writes per job
+    STAGE_QUEUE_LIMIT = int(os.getenv("STAGE_QUEUE_LIMIT", "8"))  # a stage stops claiming while its downstream queue is this deep
+    STATUS_POLL_SECONDS = float(os.getenv("STATUS_POLL_SECONDS", "1.0"))  # status stream refresh, one query for all subscribers
+    STATUS_KEEPALIVE_SECONDS = float(os.getenv("STATUS_KEEPALIVE_SECONDS", "15"))
 
 settings = Settings()
\ No newline at end of file
@@ -1,16 +1,132 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+# Async drivers for the API's engine, by database backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def _async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    scheme, _, rest = settings.DATABASE_URL.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}://{rest}"
+
+def _engine_options() -> dict:
+    options = {"pool_pre_ping": True}
+    if IS_SQLITE:
+        # The API thread pool and workers share connections across threads;
+        # timeout makes writers wait for the lock instead of erroring
+        options["connect_args"] = {
+            "check_same_thread": False,
+            "timeout": settings.DB_BUSY_TIMEOUT_MS / 1000
+        }
+    if ":memory:" not in settings.DATABASE_URL:
+        options["pool_size"] = settings.DB_POOL_SIZE
+        options["max_overflow"] = settings.DB_MAX_OVERFLOW
+    return options
+
+def _async_engine_options() -> dict:
+    if not IS_SQLITE:
+        return _engine_options()
+    # aiosqlite defaults to NullPool, which takes no sizing arguments and
+    # opens a connection (and its thread) per request; keep them pooled instead
+    options = {"connect_args": {"timeout": settings.DB_BUSY_TIMEOUT_MS / 1000}}
+    if ":memory:" not in settings.DATABASE_URL:
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW
+        )
+    return options
+
+# Workers and startup tasks use the synchronous engine; API handlers use the
+# async one so queries never block the event loop
+engine = create_engine(settings.DATABASE_URL, **_engine_options())
+async_engine = create_async_engine(_async_database_url(), **_async_engine_options())
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    # WAL lets status reads proceed while a worker writes, and
+    # busy_timeout queues concurrent writers instead of failing them
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.DB_BUSY_TIMEOUT_MS}")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+if IS_SQLITE:
+    event.listen(engine, "connect", _configure_sqlite)
+    event.listen(async_engine.sync_engine, "connect", _configure_sqlite)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+def _add_missing_columns():
+    """Upgrade tables created by older versions with columns added since
+
+    Added columns are nullable (existing rows have no value), so models only
+    ever gain optional columns on tables that may already exist.
+    """
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                print(f"Adding column {table.name}.{column.name}")
+                connection.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=engine.dialect)}"
+                ))
+
+def init_db():
+    """Create any missing tables, columns and indexes"""
+    # Import models so they register with Base.metadata
+    from app.models import meeting, job, progress, insights, analytics, transcript
+    Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+
+    # create_all skips tables that already exist, so add indexes introduced since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+async def get_db():
+    """AsyncSession for a request
+
+    Existing query helpers take a synchronous Session; handlers run them with
+    ``await db.run_sync(helper, ...)``, which executes them on the async driver.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+@contextmanager
+def session_scope():
+    """Short-lived session for background work: commits on success, rolls back on error
+
+    Objects stay readable after the block, so callers never need to hold a
+    session (and its connection) across long transcription or LLM calls.
+    """
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Float, Index
+from app.core.database import Base
+
+# Aggregates maintained as meetings complete or fail, so the dashboard reads
+# a handful of small rows instead of scanning the archive
+
+class DailyMeetingStats(Base):
+    __tablename__ = "analytics_daily"
+
+    day = Column(String, primary_key=True)  # YYYY-MM-DD the meeting was uploaded
+    meetings_completed = Column(Integer, default=0)
+    meetings_failed = Column(Integer, default=0)
+    audio_seconds = Column(Float, default=0.0)
+    processing_seconds = Column(Float, default=0.0)  # upload to insights, summed over completed meetings
+
+class AnalyticsCounter(Base):
+    __tablename__ = "analytics_counters"
+
+    kind = Column(String, primary_key=True)  # assignee, topic
+    key = Column(String, primary_key=True)  # normalized key, as on the insight tables
+    label = Column(String)  # display form of the first occurrence
+    count = Column(Integer, default=0)
+
+    __table_args__ = (
+        # Top-N per kind
+        Index("ix_analytics_counters_kind_count", "kind", "count"),
+    )
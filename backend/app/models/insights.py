@@ -0,0 +1,64 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# Normalized copies of the insight JSON on Meeting, one row per extracted item,
+# so cross-meeting questions run as indexed SQL. *_key columns hold a
+# case-folded, whitespace-collapsed form used for lookups.
+
+class ActionItem(Base):
+    __tablename__ = "action_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(String, index=True)
+    position = Column(Integer, default=0)  # order within the meeting
+    assignee = Column(String, nullable=True)
+    assignee_key = Column(String, nullable=True)
+    task = Column(Text)
+    deadline = Column(String, nullable=True)  # as extracted; free-form
+    status = Column(String, default="open")  # open, done
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_action_items_assignee_key_status", "assignee_key", "status", "id"),
+    )
+
+class Decision(Base):
+    __tablename__ = "decisions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(String, index=True)
+    position = Column(Integer, default=0)
+    decision = Column(Text)
+    made_by = Column(String, nullable=True)
+    made_by_key = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_decisions_made_by_key", "made_by_key", "id"),
+    )
+
+class Participant(Base):
+    __tablename__ = "participants"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(String, index=True)
+    name = Column(String)
+    name_key = Column(String)
+    role = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_participants_name_key_meeting_id", "name_key", "meeting_id"),
+    )
+
+class MeetingTopic(Base):
+    __tablename__ = "meeting_topics"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(String, index=True)
+    topic = Column(String)
+    topic_key = Column(String)
+
+    __table_args__ = (
+        Index("ix_meeting_topics_topic_key_meeting_id", "topic_key", "meeting_id"),
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(String, index=True)
+    stage = Column(String)
+    status = Column(String, default="queued")  # queued, running, done, failed
+    payload = Column(JSON, nullable=True)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    run_after = Column(DateTime, server_default=func.now())
+    locked_by = Column(String, nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # Workers poll for the next runnable job of their stage
+        Index("ix_jobs_stage_status_run_after", "stage", "status", "run_after"),
+    )
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Float, Index
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -8,11 +9,23 @@ class Meeting(Base):
     id = Column(Integer, primary_key=True, index=True)
     meeting_id = Column(String, unique=True, index=True)
     filename = Column(String)
+    file_path = Column(String, nullable=True)  # saved upload, needed to resume processing
     status = Column(String, default="uploaded")
-    transcript = Column(Text, nullable=True)
-    action_items = Column(JSON, nullable=True)
-    decisions = Column(JSON, nullable=True)
-    participants = Column(JSON, nullable=True)
-    topics = Column(JSON, nullable=True)
+    # Large content columns load only when accessed or undeferred as a group,
+    # so listing and status queries never pull transcripts
+    transcript = deferred(Column(Text, nullable=True), group="content")
+    action_items = deferred(Column(JSON, nullable=True), group="content")
+    decisions = deferred(Column(JSON, nullable=True), group="content")
+    participants = deferred(Column(JSON, nullable=True), group="content")
+    topics = deferred(Column(JSON, nullable=True), group="content")
+    whisper_model = Column(String, nullable=True)  # None means settings.WHISPER_MODEL
+    speech_ratio = Column(Float, nullable=True)  # fraction of audio sent to Whisper after VAD
+    insights_version = Column(Integer, nullable=True)  # insight_service.INSIGHTS_VERSION of its insight rows
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # Keyset pagination of the meeting list, optionally filtered by status
+        Index("ix_meetings_created_at_id", "created_at", "id"),
+        Index("ix_meetings_status_created_at_id", "status", "created_at", "id"),
+    )
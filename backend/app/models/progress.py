@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float
+from app.core.database import Base
+
+class MeetingProgress(Base):
+    """Fine-grained processing progress, one row per meeting, written by workers"""
+    __tablename__ = "meeting_progress"
+
+    meeting_id = Column(String, primary_key=True)
+    stage = Column(String, nullable=True)  # transcribe, extract, index
+    phase = Column(String, nullable=True)  # decoding, transcribing, extracting, indexing, done
+    audio_seconds = Column(Float, nullable=True)  # recording length, known once decoded
+    decoded_seconds = Column(Float, default=0.0)
+    speech_seconds = Column(Float, nullable=True)  # audio actually sent to Whisper after VAD
+    transcribed_seconds = Column(Float, default=0.0)
+    windows_done = Column(Integer, default=0)
+    windows_total = Column(Integer, nullable=True)
+    real_time_factor = Column(Float, nullable=True)  # transcription wall time per second of speech
+    stage_started_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
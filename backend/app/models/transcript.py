@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Text, Float, Index
+from app.core.database import Base
+
+class TranscriptSegment(Base):
+    """One timestamped Whisper segment, so transcripts can be served a page at a time"""
+    __tablename__ = "transcript_segments"
+
+    id = Column(Integer, primary_key=True)
+    meeting_id = Column(String)
+    position = Column(Integer)  # order within the meeting
+    start = Column(Float)  # seconds from the start of the recording
+    end = Column(Float)
+    text = Column(Text)
+    avg_logprob = Column(Float, nullable=True)
+
+    __table_args__ = (
+        # Paging by position and seeking by time within one meeting
+        Index("ix_transcript_segments_meeting_id_position", "meeting_id", "position"),
+        Index("ix_transcript_segments_meeting_id_start", "meeting_id", "start"),
+    )
@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.database import session_scope
+from app.models.meeting import Meeting
+from app.models.progress import MeetingProgress
+from app.models.insights import ActionItem, MeetingTopic
+from app.models.analytics import DailyMeetingStats, AnalyticsCounter
+
+# Aggregates are adjusted inside the transaction that changes a meeting's
+# status, so they stay consistent with the meetings table. Only transitions
+# into completed or failed are counted, which keeps retried jobs idempotent.
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite returns naive UTC timestamps, other databases may return aware ones
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _day(created_at: Optional[datetime]) -> str:
+    return (created_at or datetime.utcnow()).date().isoformat()
+
+def _bump_day(db: Session, day: str, **increments):
+    updated = db.query(DailyMeetingStats).filter(DailyMeetingStats.day == day).update({
+        getattr(DailyMeetingStats, name): getattr(DailyMeetingStats, name) + value
+        for name, value in increments.items()
+    }, synchronize_session=False)
+    if not updated:
+        db.add(DailyMeetingStats(day=day, **increments))
+        # Flush so a second bump in this transaction finds the row
+        db.flush()
+
+def _bump_counter(db: Session, kind: str, key: str, label: str, delta: int):
+    updated = db.query(AnalyticsCounter).filter(
+        AnalyticsCounter.kind == kind, AnalyticsCounter.key == key
+    ).update({AnalyticsCounter.count: AnalyticsCounter.count + delta}, synchronize_session=False)
+    if not updated and delta > 0:
+        db.add(AnalyticsCounter(kind=kind, key=key, label=label, count=delta))
+        db.flush()
+
+def _insight_counts(rows) -> list:
+    """(kind, key, label) for each counted insight row"""
+    counts = []
+    for row in rows:
+        if isinstance(row, ActionItem) and row.assignee_key:
+            counts.append(("assignee", row.assignee_key, row.assignee))
+        elif isinstance(row, MeetingTopic):
+            counts.append(("topic", row.topic_key, row.topic))
+    return counts
+
+def retract_insight_counts(db: Session, meeting_id: str):
+    """Remove a meeting's current insight rows from the counters before they are replaced"""
+    rows = db.query(ActionItem).filter(ActionItem.meeting_id == meeting_id).all()
+    rows += db.query(MeetingTopic).filter(MeetingTopic.meeting_id == meeting_id).all()
+    for kind, key, label in _insight_counts(rows):
+        _bump_counter(db, kind, key, label, -1)
+
+def record_meeting_completed(db: Session, meeting_id: str, previous_status: str,
+                             created_at: Optional[datetime], rows: list):
+    """Count a meeting's insights, and on its first completion its day totals"""
+    for kind, key, label in _insight_counts(rows):
+        _bump_counter(db, kind, key, label, 1)
+
+    if previous_status != "completed":
+        created_at = _naive_utc(created_at)
+        audio_seconds = db.query(MeetingProgress.audio_seconds).filter(
+            MeetingProgress.meeting_id == meeting_id
+        ).scalar()
+        processing = (datetime.utcnow() - created_at).total_seconds() if created_at else 0.0
+        _bump_day(
+            db, _day(created_at),
+            meetings_completed=1,
+            # A failed meeting that was requeued by hand moves between the totals
+            meetings_failed=-1 if previous_status == "failed" else 0,
+            audio_seconds=audio_seconds or 0.0,
+            processing_seconds=max(processing, 0.0)
+        )
+
+def record_meeting_failed(db: Session, meeting_id: str):
+    created_at = db.query(Meeting.created_at).filter(Meeting.meeting_id == meeting_id).scalar()
+    _bump_day(db, _day(created_at), meetings_failed=1)
+
+def _top_counters(db: Session, kind: str, limit: int) -> List[dict]:
+    counters = db.query(AnalyticsCounter.label, AnalyticsCounter.count).filter(
+        AnalyticsCounter.kind == kind, AnalyticsCounter.count > 0
+    ).order_by(AnalyticsCounter.count.desc()).limit(limit).all()
+    return [{"name": label, "count": count} for label, count in counters]
+
+def get_analytics(db: Session, days: int = 30, top: int = 10) -> dict:
+    """Dashboard figures read from the aggregate tables"""
+    totals = db.query(
+        func.sum(DailyMeetingStats.meetings_completed),
+        func.sum(DailyMeetingStats.meetings_failed),
+        func.sum(DailyMeetingStats.audio_seconds),
+        func.sum(DailyMeetingStats.processing_seconds)
+    ).one()
+    completed, failed, audio_seconds, processing_seconds = [value or 0 for value in totals]
+    # In-flight meetings are few, and the status index makes this a range count
+    processing = db.query(func.count(Meeting.id)).filter(Meeting.status == "processing").scalar()
+
+    since = (datetime.utcnow() - timedelta(days=days)).date().isoformat()
+    daily = db.query(DailyMeetingStats).filter(
+        DailyMeetingStats.day >= since
+    ).order_by(DailyMeetingStats.day).all()
+
+    return {
+        "total_meetings": completed + failed + processing,
+        "completed": completed,
+        "processing": processing,
+        "failed": failed,
+        "total_audio_seconds": audio_seconds,
+        "avg_processing_seconds": processing_seconds / completed if completed else None,
+        "meetings_per_day": [
+            {"day": row.day, "completed": row.meetings_completed, "failed": row.meetings_failed}
+            for row in daily
+        ],
+        "action_items_by_assignee": _top_counters(db, "assignee", top),
+        "topics": _top_counters(db, "topic", top),
+    }
+
+def rebuild_analytics() -> bool:
+    """Build the aggregates from existing meetings the first time they're needed
+
+    Runs once on an archive that predates the aggregate tables; afterwards
+    they are maintained incrementally and this is a no-op.
+    """
+    with session_scope() as db:
+        if db.query(DailyMeetingStats.day).first() or db.query(AnalyticsCounter.kind).first():
+            return False
+
+        meetings = db.query(
+            Meeting.meeting_id, Meeting.status, Meeting.created_at,
+            Meeting.updated_at, MeetingProgress.audio_seconds
+        ).outerjoin(
+            MeetingProgress, MeetingProgress.meeting_id == Meeting.meeting_id
+        ).filter(Meeting.status.in_(["completed", "failed"])).yield_per(1000)
+
+        days = {}
+        for meeting_id, status, created_at, updated_at, audio_seconds in meetings:
+            day = days.setdefault(_day(created_at), DailyMeetingStats(
+                day=_day(created_at), meetings_completed=0, meetings_failed=0,
+                audio_seconds=0.0, processing_seconds=0.0
+            ))
+            if status == "failed":
+                day.meetings_failed += 1
+                continue
+            day.meetings_completed += 1
+            day.audio_seconds += audio_seconds or 0.0
+            if created_at and updated_at:
+                elapsed = _naive_utc(updated_at) - _naive_utc(created_at)
+                day.processing_seconds += max(elapsed.total_seconds(), 0.0)
+        db.add_all(days.values())
+
+        assignees = db.query(
+            ActionItem.assignee_key, func.min(ActionItem.assignee), func.count(ActionItem.id)
+        ).filter(ActionItem.assignee_key.isnot(None)).group_by(ActionItem.assignee_key)
+        topics = db.query(
+            MeetingTopic.topic_key, func.min(MeetingTopic.topic), func.count(MeetingTopic.id)
+        ).group_by(MeetingTopic.topic_key)
+        for kind, query in (("assignee", assignees), ("topic", topics)):
+            db.add_all(
+                AnalyticsCounter(kind=kind, key=key, label=label, count=count)
+                for key, label, count in query
+            )
+
+        return bool(days)
@@ -1,9 +1,10 @@
-import asyncio
+from typing import List, Optional
 from ai.extraction.llm_client import extract_meeting_insights
 
-async def process_extraction(transcript: str) -> dict:
-    """Process extraction of insights from transcript"""
-    # Simulate processing time
-    await asyncio.sleep(3)
-    
-    return extract_meeting_insights(transcript)
\ No newline at end of file
+async def process_extraction(transcript: str, segments: Optional[List[str]] = None) -> dict:
+    """Process extraction of insights from transcript
+
+    segments, the texts of the transcript's segments in order, give
+    map-reduce extraction natural places to split long transcripts.
+    """
+    return await extract_meeting_insights(transcript, segments)
@@ -1,22 +1,181 @@
 import os
-import uuid
+import time
+import asyncio
 from typing import Tuple
+from multipart.multipart import MultipartParser, parse_options_header
 from app.core.config import settings
-from pydub import AudioSegment
-from moviepy.editor import VideoFileClip
+from ai.transcription.audio import PcmAudio, split_on_silence
 
-def save_uploaded_file(file, meeting_id: str) -> str:
-    """Save uploaded file and return file path"""
-    if not os.path.exists(settings.UPLOAD_DIR):
-        os.makedirs(settings.UPLOAD_DIR)
+# Allowance for multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Largest non-file form field kept in memory
+MAX_FORM_FIELD_SIZE = 64 * 1024
+
+class FileTooLargeError(Exception):
+    """Raised when an upload exceeds settings.MAX_FILE_SIZE"""
+    pass
+
+class InvalidUploadError(Exception):
+    """Raised when an upload request isn't a usable multipart form"""
+    pass
+
+# Audio and video containers ffmpeg decodes for transcription
+UPLOAD_EXTENSIONS = {
+    "mp3", "wav", "m4a", "aac", "flac", "ogg", "oga", "opus", "weba", "webm", "wma", "amr", "aif", "aiff",
+    "mp4", "m4v", "3gp", "avi", "mov", "wmv", "flv", "mkv", "mpeg", "mpg"
+}
+
+def upload_file_name(filename: str) -> Tuple[str, str]:
+    """Client-supplied filename reduced to its base name, and its extension
+
+    Raises InvalidUploadError for files that aren't a supported audio or
+    video format, so nothing but "<id>.<known extension>" is ever written.
+    """
+    filename = os.path.basename(filename.replace("\\", "/")).strip()
+    _, _, extension = filename.rpartition(".")
+    extension = extension.lower()
+    if not filename or extension not in UPLOAD_EXTENSIONS:
+        raise InvalidUploadError(f"Unsupported file type: {filename or 'no filename'}")
+    return filename, extension
+
+def _too_large() -> FileTooLargeError:
+    return FileTooLargeError(f"Upload exceeds maximum size of {settings.MAX_FILE_SIZE} bytes")
+
+class _MultipartReader:
+    """Callbacks for python-multipart's streaming parser
+
+    Data of the "file" part is queued for the caller to write to disk;
+    other fields are small and collected in memory.
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self.filename = None
+        self.file_size = 0
+        self.pending = []
+        self.pending_size = 0
+        self._header_field = b""
+        self._header_value = b""
+        self._name = None
+        self._is_file = False
+        self._value = b""
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self):
+        self._name = None
+        self._is_file = False
+        self._value = b""
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def on_header_end(self):
+        if self._header_field.lower() == b"content-disposition":
+            _, options = parse_options_header(self._header_value)
+            self._name = options.get(b"name", b"").decode("utf-8", "replace")
+            if self._name == "file" and b"filename" in options:
+                if self.filename is not None:
+                    raise InvalidUploadError("Only one file may be uploaded")
+                self._is_file = True
+                self.filename = os.path.basename(options[b"filename"].decode("utf-8", "replace"))
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if self._is_file:
+            self.file_size += end - start
+            if self.file_size > settings.MAX_FILE_SIZE:
+                raise _too_large()
+            self.pending.append(data[start:end])
+            self.pending_size += end - start
+        else:
+            self._value += data[start:end]
+            if len(self._value) > MAX_FORM_FIELD_SIZE:
+                raise InvalidUploadError(f"Form field '{self._name}' is too large")
+
+    def on_part_end(self):
+        if self._name and not self._is_file:
+            self.fields[self._name] = self._value.decode("utf-8", "replace")
+
+def _check_content_length(request):
+    try:
+        content_length = int(request.headers.get("content-length", ""))
+    except ValueError:
+        return
+    if content_length > settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD:
+        raise _too_large()
+
+async def save_multipart_upload(request, meeting_id: str) -> Tuple[str, str, dict]:
+    """Stream a multipart/form-data upload straight to disk
+
+    The body is parsed as it arrives rather than spooled first, so an
+    oversized upload is refused from its Content-Length before anything is
+    read, or as soon as the file passes settings.MAX_FILE_SIZE. Returns
+    (file_path, filename, other form fields).
+    """
+    _check_content_length(request)
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or not options.get(b"boundary"):
+        raise InvalidUploadError("Expected a multipart/form-data upload")
     
-    file_extension = file.filename.split('.')[-1]
-    file_path = os.path.join(settings.UPLOAD_DIR, f"{meeting_id}.{file_extension}")
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    reader = _MultipartReader()
+    parser = MultipartParser(options[b"boundary"], reader.callbacks())
     
-    with open(file_path, "wb") as buffer:
-        buffer.write(file.file.read())
+    loop = asyncio.get_event_loop()
+    started = time.monotonic()
+    file_path = None
+    buffer = None
     
-    return file_path
+    async def flush():
+        nonlocal file_path, buffer
+        if buffer is None:
+            reader.filename, file_extension = upload_file_name(reader.filename)
+            file_path = os.path.join(settings.UPLOAD_DIR, f"{meeting_id}.{file_extension}")
+            buffer = open(file_path, "wb")
+        data = b"".join(reader.pending)
+        reader.pending, reader.pending_size = [], 0
+        # Disk writes run in a thread so the event loop keeps serving requests
+        await loop.run_in_executor(None, buffer.write, data)
+    
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            # Request chunks are small; batch them into UPLOAD_CHUNK_SIZE writes
+            if reader.pending_size >= settings.UPLOAD_CHUNK_SIZE:
+                await flush()
+        parser.finalize()
+        
+        if reader.filename is None:
+            raise InvalidUploadError("No file in upload")
+        # The remainder, or an empty file so processing reports a decode error as usual
+        await flush()
+    except BaseException:
+        # Don't leave partial uploads behind
+        if buffer is not None:
+            buffer.close()
+            os.remove(file_path)
+        raise
+    buffer.close()
+    
+    elapsed = max(time.monotonic() - started, 1e-6)
+    print(f"Saved upload {meeting_id}: {reader.file_size} bytes in {elapsed:.2f}s "
+          f"({reader.file_size / elapsed:.0f} bytes/sec)")
+    
+    return file_path, reader.filename, reader.fields
 
 def is_video_file(file_path: str) -> bool:
     """Check if file is a video"""
@@ -24,22 +183,7 @@ def is_video_file(file_path: str) -> bool:
     extension = file_path.split('.')[-1].lower()
     return extension in video_extensions
 
-def extract_audio_from_video(video_path: str) -> str:
-    """Extract audio from video file"""
-    audio_path = video_path.replace('.' + video_path.split('.')[-1], '.wav')
-    video = VideoFileClip(video_path)
-    audio = video.audio
-    audio.write_audiofile(audio_path)
-    return audio_path
-
 def segment_audio(audio_path: str, max_duration: int = 300) -> list:
-    """Segment audio file into chunks"""
-    audio = AudioSegment.from_file(audio_path)
-    segments = []
-    
-    for i, chunk in enumerate(audio[::max_duration * 1000]):
-        segment_path = audio_path.replace('.wav', f'_segment_{i}.wav')
-        chunk.export(segment_path, format="wav")
-        segments.append(segment_path)
-    
-    return segments
\ No newline at end of file
+    """Segment a PCM cache at silence boundaries into zero-copy int16 windows"""
+    audio = PcmAudio(audio_path)
+    return [audio.view(start, end) for start, end in split_on_silence(audio, max_duration)]
\ No newline at end of file
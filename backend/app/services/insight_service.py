@@ -0,0 +1,215 @@
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import exists, func, or_
+from sqlalchemy.orm import Session, load_only
+from app.core.database import session_scope
+from app.models.meeting import Meeting
+from app.models.insights import ActionItem, Decision, Participant, MeetingTopic
+
+# Meetings backfilled per transaction when normalizing older rows
+BACKFILL_BATCH_SIZE = 200
+
+# Recorded on each meeting whose insight rows are built; bump it when
+# replace_meeting_insights changes so existing meetings are rebuilt
+INSIGHTS_VERSION = 1
+
+def normalize_key(value) -> Optional[str]:
+    """Case-folded, whitespace-collapsed lookup key for names and topics"""
+    if not isinstance(value, str):
+        return None
+    key = re.sub(r"\s+", " ", value).strip().casefold()
+    return key or None
+
+def _prefix_filter(column, value: str):
+    """Index-friendly match on keys starting with value ("sarah" finds "sarah johnson")"""
+    key = normalize_key(value) or ""
+    return (column >= key) & (column < key + "\uffff")
+
+def _items(insights: dict, field: str) -> list:
+    """An insight list, or nothing if the LLM returned some other shape (e.g. a bare string)"""
+    value = insights.get(field)
+    return value if isinstance(value, list) else []
+
+def _text(item: dict, field: str) -> Optional[str]:
+    value = item.get(field)
+    return str(value) if value is not None else None
+
+def replace_meeting_insights(db: Session, meeting_id: str, insights: dict):
+    """Rewrite a meeting's normalized insight rows from extraction output
+
+    Runs in the caller's transaction, so the rows always match the JSON
+    columns written alongside them. Malformed items from the LLM are skipped.
+    The meeting is marked with INSIGHTS_VERSION, even if nothing was
+    extracted, so the backfill doesn't revisit it. Returns the new rows.
+    """
+    for model in (ActionItem, Decision, Participant, MeetingTopic):
+        db.query(model).filter(model.meeting_id == meeting_id).delete(synchronize_session=False)
+    db.query(Meeting).filter(Meeting.meeting_id == meeting_id).update(
+        {Meeting.insights_version: INSIGHTS_VERSION}, synchronize_session=False
+    )
+
+    rows = []
+    for position, item in enumerate(_items(insights, "action_items")):
+        if isinstance(item, dict) and item.get("task"):
+            rows.append(ActionItem(
+                meeting_id=meeting_id,
+                position=position,
+                assignee=_text(item, "assignee"),
+                assignee_key=normalize_key(item.get("assignee")),
+                task=_text(item, "task"),
+                deadline=_text(item, "deadline"),
+                status="open"
+            ))
+
+    for position, item in enumerate(_items(insights, "decisions")):
+        if isinstance(item, dict) and item.get("decision"):
+            rows.append(Decision(
+                meeting_id=meeting_id,
+                position=position,
+                decision=_text(item, "decision"),
+                made_by=_text(item, "made_by"),
+                made_by_key=normalize_key(item.get("made_by"))
+            ))
+
+    names = set()
+    for item in _items(insights, "participants"):
+        key = normalize_key(item.get("name")) if isinstance(item, dict) else None
+        if key and key not in names:
+            names.add(key)
+            rows.append(Participant(
+                meeting_id=meeting_id, name=_text(item, "name"), name_key=key, role=_text(item, "role")
+            ))
+
+    topics = set()
+    for topic in _items(insights, "topics"):
+        key = normalize_key(topic)
+        if key and key not in topics:
+            topics.add(key)
+            rows.append(MeetingTopic(meeting_id=meeting_id, topic=topic.strip(), topic_key=key))
+
+    db.add_all(rows)
+    return rows
+
+def find_action_items(
+    db: Session,
+    assignee: Optional[str] = None,
+    status: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[int] = None
+) -> Tuple[List[ActionItem], Optional[int]]:
+    """Action items across meetings, newest first, and the cursor for the next page"""
+    query = db.query(ActionItem)
+    if assignee:
+        query = query.filter(_prefix_filter(ActionItem.assignee_key, assignee))
+    if status:
+        query = query.filter(ActionItem.status == status)
+    if meeting_id:
+        query = query.filter(ActionItem.meeting_id == meeting_id)
+    if cursor:
+        query = query.filter(ActionItem.id < cursor)
+
+    items = query.order_by(ActionItem.id.desc()).limit(limit + 1).all()
+    if len(items) > limit:
+        return items[:limit], items[limit - 1].id
+    return items, None
+
+def find_decisions(
+    db: Session,
+    made_by: Optional[str] = None,
+    meeting_id: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[int] = None
+) -> Tuple[List[Decision], Optional[int]]:
+    """Decisions across meetings, newest first, and the cursor for the next page"""
+    query = db.query(Decision)
+    if made_by:
+        query = query.filter(_prefix_filter(Decision.made_by_key, made_by))
+    if meeting_id:
+        query = query.filter(Decision.meeting_id == meeting_id)
+    if cursor:
+        query = query.filter(Decision.id < cursor)
+
+    decisions = query.order_by(Decision.id.desc()).limit(limit + 1).all()
+    if len(decisions) > limit:
+        return decisions[:limit], decisions[limit - 1].id
+    return decisions, None
+
+def topic_counts(db: Session, prefix: Optional[str] = None, limit: int = 100) -> List[Tuple[str, int]]:
+    """Most discussed topics as (topic, meeting count)"""
+    query = db.query(
+        func.min(MeetingTopic.topic),
+        func.count(MeetingTopic.meeting_id.distinct()).label("meetings")
+    )
+    if prefix:
+        query = query.filter(_prefix_filter(MeetingTopic.topic_key, prefix))
+    return query.group_by(MeetingTopic.topic_key).order_by(
+        func.count(MeetingTopic.meeting_id.distinct()).desc()
+    ).limit(limit).all()
+
+def _meetings_in(db: Session, meeting_ids, limit: int) -> List[Meeting]:
+    return db.query(Meeting).options(load_only(
+        Meeting.id, Meeting.meeting_id, Meeting.filename, Meeting.status, Meeting.created_at
+    )).filter(Meeting.meeting_id.in_(meeting_ids)).order_by(
+        Meeting.created_at.desc(), Meeting.id.desc()
+    ).limit(limit).all()
+
+def meetings_for_topic(db: Session, topic: str, limit: int = 100) -> List[Meeting]:
+    """Meetings that discussed a topic"""
+    meeting_ids = db.query(MeetingTopic.meeting_id).filter(
+        MeetingTopic.topic_key == normalize_key(topic)
+    )
+    return _meetings_in(db, meeting_ids, limit)
+
+def meetings_for_participant(db: Session, name: str, limit: int = 100) -> List[Meeting]:
+    """Meetings a person took part in, matched on name prefix"""
+    meeting_ids = db.query(Participant.meeting_id).filter(_prefix_filter(Participant.name_key, name))
+    return _meetings_in(db, meeting_ids, limit)
+
+def _has_insight_rows():
+    """Correlated EXISTS on the indexed meeting_id of each insight table"""
+    return or_(*(
+        exists().where(model.meeting_id == Meeting.meeting_id)
+        for model in (ActionItem, Decision, Participant, MeetingTopic)
+    ))
+
+def backfill_meeting_insights() -> int:
+    """Normalize insights of completed meetings not yet at INSIGHTS_VERSION
+
+    Meetings from before the version marker that already have insight rows
+    are marked in one statement rather than rebuilt. Returns how many
+    meetings were rebuilt.
+    """
+    with session_scope() as db:
+        db.query(Meeting).filter(
+            Meeting.status == "completed",
+            Meeting.insights_version.is_(None),
+            _has_insight_rows()
+        ).update({Meeting.insights_version: INSIGHTS_VERSION}, synchronize_session=False)
+
+    backfilled = 0
+    last_id = 0
+    while True:
+        with session_scope() as db:
+            # Walk by id so each meeting is visited once, however the batch goes
+            meetings = db.query(Meeting).options(load_only(
+                Meeting.id, Meeting.meeting_id, Meeting.action_items, Meeting.decisions,
+                Meeting.participants, Meeting.topics
+            )).filter(
+                Meeting.id > last_id,
+                Meeting.status == "completed",
+                or_(Meeting.insights_version.is_(None), Meeting.insights_version < INSIGHTS_VERSION)
+            ).order_by(Meeting.id).limit(BACKFILL_BATCH_SIZE).all()
+
+            for meeting in meetings:
+                replace_meeting_insights(db, meeting.meeting_id, {
+                    "action_items": meeting.action_items,
+                    "decisions": meeting.decisions,
+                    "participants": meeting.participants,
+                    "topics": meeting.topics
+                })
+
+        if not meetings:
+            return backfilled
+        backfilled += len(meetings)
+        last_id = meetings[-1].id
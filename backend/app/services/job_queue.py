@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.job import Job
+
+# Cap on the retry delay, however many attempts have failed
+MAX_BACKOFF_SECONDS = 3600
+
+# Except for claim_job, these functions don't commit: callers batch them
+# with related writes (e.g. completing a stage and enqueuing the next one)
+
+def enqueue_job(db: Session, meeting_id: str, stage: str, payload: dict = None) -> Job:
+    """Add a job to the durable queue"""
+    job = Job(
+        meeting_id=meeting_id,
+        stage=stage,
+        status="queued",
+        payload=payload or {},
+        attempts=0,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        run_after=datetime.utcnow()
+    )
+    db.add(job)
+    return job
+
+def claim_job(db: Session, stage: str, worker_id: str) -> Optional[Job]:
+    """Atomically take the next runnable job for a stage, or None if there is none"""
+    # Another worker may win the race for a candidate, so retry a few times
+    for _ in range(5):
+        candidate = db.query(Job.id).filter(
+            Job.stage == stage,
+            Job.status == "queued",
+            Job.run_after <= datetime.utcnow()
+        ).order_by(Job.run_after, Job.id).first()
+        if candidate is None:
+            return None
+
+        now = datetime.utcnow()
+        claimed = db.query(Job).filter(
+            Job.id == candidate.id,
+            Job.status == "queued"
+        ).update({
+            Job.status: "running",
+            Job.locked_by: worker_id,
+            Job.locked_at: now,
+            Job.attempts: Job.attempts + 1
+        }, synchronize_session=False)
+        db.commit()
+
+        if claimed:
+            job = db.query(Job).filter(Job.id == candidate.id).first()
+            # Detach so the job can be used after this short session closes
+            db.expunge(job)
+            db.commit()
+            return job
+
+    return None
+
+def _holds_lease(job: Job):
+    """Filter matching the job only while this claim of it still holds the lease
+
+    Jobs in flight in one process share a worker id, so the attempt number
+    is what tells this claim apart from a later one after recovery.
+    """
+    return (
+        (Job.id == job.id)
+        & (Job.status == "running")
+        & (Job.locked_by == job.locked_by)
+        & (Job.attempts == job.attempts)
+    )
+
+def heartbeat_job(db: Session, job: Job):
+    """Extend the lease on a running job"""
+    db.query(Job).filter(_holds_lease(job)).update(
+        {Job.locked_at: datetime.utcnow()}, synchronize_session=False
+    )
+
+def complete_job(db: Session, job: Job) -> bool:
+    """Mark a job as done
+
+    Returns False, changing nothing, if the worker's lease was lost and the
+    job recovered for another worker; the caller must then not enqueue the
+    next stage, or it would run twice.
+    """
+    completed = db.query(Job).filter(_holds_lease(job)).update({
+        Job.status: "done",
+        Job.locked_by: None,
+        Job.locked_at: None
+    }, synchronize_session=False)
+    return bool(completed)
+
+def fail_job(db: Session, job: Job, error: str) -> Optional[str]:
+    """Record a failed attempt; requeue with exponential backoff if attempts remain.
+
+    Returns the job's new status, "queued" or "failed", or None if the
+    worker no longer held the job's lease and nothing was recorded.
+    """
+    values = {
+        Job.last_error: error,
+        Job.locked_by: None,
+        Job.locked_at: None
+    }
+
+    if job.attempts < job.max_attempts:
+        delay = min(settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1), MAX_BACKOFF_SECONDS)
+        values[Job.status] = "queued"
+        values[Job.run_after] = datetime.utcnow() + timedelta(seconds=delay)
+    else:
+        values[Job.status] = "failed"
+
+    updated = db.query(Job).filter(_holds_lease(job)).update(values, synchronize_session=False)
+    return values[Job.status] if updated else None
+
+def _stale_filter():
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    return (Job.status == "running") & (Job.locked_at < cutoff)
+
+def recover_stale_jobs(db: Session) -> int:
+    """Requeue running jobs whose worker stopped heartbeating (crashed or killed)
+
+    Only jobs with attempts left are requeued; see fail_stale_jobs.
+    """
+    recovered = db.query(Job).filter(
+        _stale_filter(),
+        Job.attempts < Job.max_attempts
+    ).update({
+        Job.status: "queued",
+        Job.locked_by: None,
+        Job.locked_at: None,
+        Job.last_error: "Worker stopped while running the job",
+        Job.run_after: datetime.utcnow()
+    }, synchronize_session=False)
+    return recovered
+
+def fail_stale_jobs(db: Session) -> List[Tuple[str, str]]:
+    """Fail stale jobs that have used all their attempts
+
+    A job that kills its worker (out of memory on a long recording, say)
+    would otherwise be requeued and crash a worker forever. Returns the
+    (meeting_id, stage) of each failed job.
+    """
+    stale = db.query(Job.id, Job.meeting_id, Job.stage).filter(
+        _stale_filter(),
+        Job.attempts >= Job.max_attempts
+    ).all()
+    if stale:
+        db.query(Job).filter(
+            Job.id.in_([job_id for job_id, _, _ in stale]),
+            Job.status == "running"
+        ).update({
+            Job.status: "failed",
+            Job.locked_by: None,
+            Job.locked_at: None,
+            Job.last_error: "Worker stopped while running the job; no attempts left"
+        }, synchronize_session=False)
+    return [(meeting_id, stage) for _, meeting_id, stage in stale]
+
+def count_queued(db: Session, stage: str) -> int:
+    """Number of jobs waiting for a stage, used to bound inter-stage queues"""
+    return db.query(Job.id).filter(Job.stage == stage, Job.status == "queued").count()
+
+def count_by_stage(db: Session) -> dict:
+    """Queued and running job counts per stage, e.g. {"transcribe": {"queued": 3, "running": 1}}"""
+    counts = {}
+    rows = db.query(Job.stage, Job.status, func.count(Job.id)).filter(
+        Job.status.in_(["queued", "running"])
+    ).group_by(Job.stage, Job.status).all()
+    for stage, status, count in rows:
+        counts.setdefault(stage, {})[status] = count
+    return counts
+
+def has_pending_job(db: Session, meeting_id: str) -> bool:
+    """Whether a meeting still has queued or running work"""
+    return db.query(Job.id).filter(
+        Job.meeting_id == meeting_id,
+        Job.status.in_(["queued", "running"])
+    ).first() is not None
@@ -0,0 +1,166 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional
+from app.core.config import settings
+from app.core.database import session_scope
+from app.models.meeting import Meeting
+from app.services.job_queue import enqueue_job
+from app.services.progress_service import ProgressReporter
+from app.services.segment_service import append_transcript_segments, transcript_text
+from app.services.analytics_service import record_meeting_failed
+from ai.transcription.audio import PcmWriter, SAMPLE_RATE
+from ai.transcription.live import LiveWindow
+
+class LiveSession:
+    """Transcribes one live meeting stream into its Meeting record
+
+    Raw audio goes to a PCM cache on disk as it arrives, and stable segments
+    are stored as they're committed, so neither memory nor latency grows with
+    call length. When the stream ends the meeting joins the normal pipeline
+    at extraction, or at transcription from the saved audio if live
+    transcription fell behind and skipped any of it.
+    """
+
+    def __init__(self, meeting_id: str, filename: str, model_name: Optional[str] = None):
+        self.meeting_id = meeting_id
+        self.filename = filename
+        self.model_name = model_name
+        self.file_path = os.path.join(settings.UPLOAD_DIR, f"{meeting_id}.pcm")
+        self.window = LiveWindow(
+            settings.LIVE_WINDOW_SECONDS,
+            settings.LIVE_HOLDBACK_SECONDS,
+            settings.LIVE_MAX_BUFFER_SECONDS
+        )
+        self.progress = ProgressReporter(meeting_id, "live")
+        self._writer = None
+        # One thread for the session's file and database writes keeps them in order,
+        # even if the handler is cancelled while a frame is being written
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"live-{meeting_id[:8]}")
+        self._transcriber = None
+        self._committed = 0
+        self._committed_seconds = 0.0
+        self._incomplete = False
+        self._stopped = False
+        self._wakeup = asyncio.Event()
+
+    def _open(self):
+        from ai.transcription.whisper_client import get_transcriber
+
+        os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+        self._writer = PcmWriter(self.file_path)
+        # file_path stays unset until the stream ends, so workers
+        # restarting mid-call don't try to resume the meeting
+        with session_scope() as db:
+            db.add(Meeting(
+                meeting_id=self.meeting_id,
+                filename=self.filename,
+                status="processing",
+                whisper_model=self.model_name
+            ))
+        self.progress.start("transcribing", audio_seconds=0.0)
+        self._transcriber = get_transcriber()
+
+    async def start(self):
+        await asyncio.get_event_loop().run_in_executor(self._io, self._open)
+
+    async def feed(self, data: bytes):
+        """Accept a frame of s16le 16 kHz mono audio"""
+        await asyncio.get_event_loop().run_in_executor(self._io, self._writer.write, data)
+        self.window.append(data)
+        self._wakeup.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+
+    async def run(self, on_segments: Callable[[List[dict]], Awaitable[None]]):
+        """Transcribe until stop() and the remaining audio is drained
+
+        on_segments receives each run of committed segments.
+        """
+        while not self._stopped:
+            if self.window.pending_seconds() < settings.LIVE_STEP_SECONDS:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            segments = await self._transcribe_pass()
+            if segments:
+                await on_segments(segments)
+
+        while self.window.buffered_seconds > 0:
+            segments = await self._transcribe_pass(final=True)
+            if segments is None:
+                self._incomplete = True
+                break
+            if segments:
+                await on_segments(segments)
+
+    async def _transcribe_pass(self, final: bool = False) -> Optional[List[dict]]:
+        """Transcribe the current window and store what it commits; None on failure"""
+        last = final and self.window.is_last_window()
+        start, audio = self.window.window()
+        try:
+            result = await asyncio.wrap_future(self._transcriber.submit(audio, self.model_name))
+        except Exception as e:
+            # The audio stays buffered and is retried on the next pass
+            print(f"Live transcription error for {self.meeting_id}: {e}")
+            return None
+
+        committed = self.window.commit(start, len(audio) / SAMPLE_RATE, result, final=last)
+        segments = [
+            dict(segment, id=self._committed + i, text=" " + segment["text"].strip())
+            for i, segment in enumerate(committed)
+        ]
+        self._committed += len(segments)
+        if segments:
+            self._committed_seconds = segments[-1]["end"]
+        await asyncio.get_event_loop().run_in_executor(self._io, self._store, segments)
+        return segments
+
+    def _store(self, segments: List[dict]):
+        if segments:
+            with session_scope() as db:
+                append_transcript_segments(db, self.meeting_id, segments)
+        self.progress.update(
+            audio_seconds=self.window.received_seconds,
+            decoded_seconds=self.window.received_seconds,
+            transcribed_seconds=self._committed_seconds
+        )
+
+    def _close(self) -> str:
+        self._writer.close()
+        self.progress.flush()
+        with session_scope() as db:
+            if not self._writer.num_bytes:
+                failed = db.query(Meeting).filter(
+                    Meeting.meeting_id == self.meeting_id,
+                    Meeting.status != "failed"
+                ).update({Meeting.status: "failed"}, synchronize_session=False)
+                if failed:
+                    record_meeting_failed(db, self.meeting_id)
+                return "failed"
+
+            values = {Meeting.file_path: self.file_path}
+            if self._incomplete or self.window.dropped_seconds:
+                # Some audio never reached Whisper; redo it from the saved recording
+                print(f"Live meeting {self.meeting_id} skipped {self.window.dropped_seconds:.0f}s, retranscribing")
+                stage = "transcribe"
+            else:
+                values[Meeting.transcript] = transcript_text(db, self.meeting_id)
+                stage = "extract"
+            db.query(Meeting).filter(Meeting.meeting_id == self.meeting_id).update(
+                values, synchronize_session=False
+            )
+            enqueue_job(db, self.meeting_id, stage, {"file_path": self.file_path})
+            return "processing"
+
+    async def finish(self) -> str:
+        """Save the recording and transcript and hand the meeting to the workers
+
+        Returns the meeting's status.
+        """
+        try:
+            return await asyncio.get_event_loop().run_in_executor(self._io, self._close)
+        finally:
+            self._io.shutdown(wait=False)
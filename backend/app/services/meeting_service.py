@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session, load_only
+from app.models.meeting import Meeting
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor can't be decoded"""
+
+def _created_at_bound(db: Session, value: datetime):
+    """A created_at filter bound that compares correctly with stored values
+
+    created_at is stored as naive UTC with whole seconds, so bounds are
+    converted to that. SQLite compares datetimes as text, and a bound
+    Python datetime is sent with a fractional part the stored values lack,
+    so there it is reformatted by datetime() too.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    value = value.replace(microsecond=0)
+    if db.get_bind().dialect.name == "sqlite":
+        return func.datetime(value)
+    return value
+
+def list_meetings_page(
+    db: Session,
+    limit: int,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+) -> Tuple[List[Meeting], Optional[str]]:
+    """One page of meetings, newest first, and the cursor for the next page
+
+    Pages are keyed on (created_at, id) rather than an offset, so each page is
+    an index range scan no matter how deep into the archive it is.
+    """
+    query = db.query(Meeting).options(load_only(
+        # Only the columns MeetingResponse needs
+        Meeting.id, Meeting.meeting_id, Meeting.filename, Meeting.status, Meeting.created_at
+    ))
+
+    if status:
+        query = query.filter(Meeting.status == status)
+    if created_after:
+        query = query.filter(Meeting.created_at >= _created_at_bound(db, created_after))
+    if created_before:
+        query = query.filter(Meeting.created_at < _created_at_bound(db, created_before))
+
+    if cursor:
+        try:
+            last_id = int(cursor)
+        except ValueError:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}")
+        # The cursor row's created_at is read in SQL so it compares in the
+        # database's own format rather than a re-encoded Python datetime
+        last_created_at = db.query(Meeting.created_at).filter(Meeting.id == last_id).scalar_subquery()
+        query = query.filter(tuple_(Meeting.created_at, Meeting.id) < tuple_(last_created_at, last_id))
+
+    # One extra row tells whether another page exists
+    meetings = query.order_by(Meeting.created_at.desc(), Meeting.id.desc()).limit(limit + 1).all()
+    if len(meetings) > limit:
+        return meetings[:limit], str(meetings[limit - 1].id)
+    return meetings, None
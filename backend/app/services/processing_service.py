@@ -0,0 +1,149 @@
+import asyncio
+from typing import Optional
+from app.core.config import settings
+from app.core.database import session_scope
+from app.models.meeting import Meeting
+from app.services.transcription_service import process_transcription, remove_pcm_cache
+from app.services.extraction_service import process_extraction
+from app.services.search_service import store_meeting_vectors
+from app.services.progress_service import ProgressReporter
+from app.services.insight_service import replace_meeting_insights
+from app.services.segment_service import (
+    clear_transcript_segments, append_transcript_segments, replace_transcript_segments,
+    transcript_segment_texts
+)
+from app.services.analytics_service import (
+    retract_insight_counts, record_meeting_completed, record_meeting_failed
+)
+
+# Processing stages in order; each runs as its own job so stages of
+# different meetings overlap (meeting N extracts while N+1 transcribes)
+PIPELINE_STAGES = ["transcribe", "extract", "index"]
+
+# Stage functions open a short session to read their inputs and another to
+# write results, so no session or connection is held during slow AI calls
+
+def next_stage(stage: str) -> Optional[str]:
+    """Stage that follows the given one, or None at the end of the pipeline"""
+    index = PIPELINE_STAGES.index(stage)
+    return PIPELINE_STAGES[index + 1] if index + 1 < len(PIPELINE_STAGES) else None
+
+def _update_meeting(meeting_id: str, values: dict):
+    """Write several meeting columns in a single UPDATE"""
+    with session_scope() as db:
+        db.query(Meeting).filter(Meeting.meeting_id == meeting_id).update(
+            values, synchronize_session=False
+        )
+
+def _load_transcript(meeting_id: str):
+    with session_scope() as db:
+        return db.query(Meeting.transcript).filter(Meeting.meeting_id == meeting_id).first()
+
+async def transcribe_meeting(meeting_id: str, file_path: str):
+    """Transcription stage: decode and transcribe the recording"""
+    with session_scope() as db:
+        meeting = db.query(Meeting.whisper_model).filter(Meeting.meeting_id == meeting_id).first()
+    if meeting is None:
+        print(f"Meeting {meeting_id} no longer exists, skipping")
+        return
+    
+    progress = ProgressReporter(meeting_id, "transcribe")
+    progress.start(
+        "decoding", audio_seconds=None, decoded_seconds=0.0, speech_seconds=None,
+        transcribed_seconds=0.0, windows_done=0, windows_total=None, real_time_factor=None
+    )
+    
+    # Segments are published as windows finish, so readers of the transcript
+    # endpoint see text long before the whole recording is done
+    with session_scope() as db:
+        clear_transcript_segments(db, meeting_id)
+    
+    def publish_segments(segments):
+        with session_scope() as db:
+            append_transcript_segments(db, meeting_id, segments)
+    
+    # Transcription (decodes audio or video straight to 16 kHz mono)
+    transcription = await process_transcription(
+        file_path, meeting.whisper_model, progress, publish_segments
+    )
+    progress.flush()
+    
+    # Full text for extraction and search; segments are rewritten whole so
+    # they match it exactly, e.g. when the array path published nothing
+    with session_scope() as db:
+        db.query(Meeting).filter(Meeting.meeting_id == meeting_id).update({
+            Meeting.transcript: transcription["text"],
+            Meeting.speech_ratio: transcription.get("speech_ratio")
+        }, synchronize_session=False)
+        replace_transcript_segments(db, meeting_id, transcription.get("segments", []))
+    
+    # The decoded audio is about 115 MB per hour; only the original upload is kept
+    remove_pcm_cache(file_path)
+
+async def extract_meeting(meeting_id: str):
+    """Extraction stage: pull action items, decisions, participants and topics"""
+    meeting = _load_transcript(meeting_id)
+    if meeting is None:
+        print(f"Meeting {meeting_id} no longer exists, skipping")
+        return
+    
+    transcript = meeting.transcript or ""
+    segments = None
+    if len(transcript) > settings.EXTRACT_CHUNK_CHARS:
+        # Long transcripts are extracted in chunks, split between segments
+        with session_scope() as db:
+            segments = transcript_segment_texts(db, meeting_id)
+    
+    ProgressReporter(meeting_id, "extract").start("extracting")
+    insights = await process_extraction(transcript, segments)
+    
+    # Insights, their normalized rows, the status change and the dashboard
+    # aggregates land in one transaction
+    with session_scope() as db:
+        previous = db.query(Meeting.status, Meeting.created_at).filter(
+            Meeting.meeting_id == meeting_id
+        ).first()
+        if previous is None:
+            return
+        if previous.status == "completed":
+            # Re-extracted after a retry: replace rather than add to its counts
+            retract_insight_counts(db, meeting_id)
+        
+        db.query(Meeting).filter(Meeting.meeting_id == meeting_id).update({
+            Meeting.action_items: insights.get("action_items", []),
+            Meeting.decisions: insights.get("decisions", []),
+            Meeting.participants: insights.get("participants", []),
+            Meeting.topics: insights.get("topics", []),
+            Meeting.status: "completed"
+        }, synchronize_session=False)
+        rows = replace_meeting_insights(db, meeting_id, insights)
+        record_meeting_completed(db, meeting_id, previous.status, previous.created_at, rows)
+
+async def index_meeting(meeting_id: str):
+    """Indexing stage: store the transcript in the vector database"""
+    meeting = _load_transcript(meeting_id)
+    if meeting is None:
+        print(f"Meeting {meeting_id} no longer exists, skipping")
+        return
+    
+    progress = ProgressReporter(meeting_id, "index")
+    progress.start("indexing")
+    # Embedding and the Chroma calls block, so they run off the event loop,
+    # which must stay free to send the job's heartbeats
+    await asyncio.get_event_loop().run_in_executor(
+        None, store_meeting_vectors, meeting_id, meeting.transcript or ""
+    )
+    progress.update(force=True, phase="done")
+
+def resume_stage(has_transcript: bool) -> str:
+    """First stage still to run for an interrupted meeting"""
+    return "extract" if has_transcript else "transcribe"
+
+def mark_meeting_failed(meeting_id: str, db):
+    """Flag a meeting whose processing can't be completed"""
+    failed = db.query(Meeting).filter(
+        Meeting.meeting_id == meeting_id,
+        Meeting.status != "failed"
+    ).update({Meeting.status: "failed"}, synchronize_session=False)
+    if failed:
+        record_meeting_failed(db, meeting_id)
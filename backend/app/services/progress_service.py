@@ -0,0 +1,150 @@
+import time
+import threading
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import session_scope
+from app.models.meeting import Meeting
+from app.models.progress import MeetingProgress
+
+# Share of overall progress covered by each stage, as (start, end) percentages
+STAGE_WEIGHTS = {
+    "transcribe": (0, 80),
+    "extract": (80, 95),
+    "index": (95, 100),
+}
+
+# Share of the transcribe stage spent decoding before Whisper starts
+DECODE_WEIGHT = 0.1
+
+class ProgressReporter:
+    """Records a job's progress in the meeting_progress table
+
+    Workers report as often as they like (per decoded chunk, per window);
+    writes are coalesced to at most one every settings.PROGRESS_UPDATE_SECONDS
+    so polling clients see fresh numbers without the table becoming a hotspot.
+    Safe to call from executor threads.
+    """
+
+    def __init__(self, meeting_id: str, stage: str):
+        self.meeting_id = meeting_id
+        self.stage = stage
+        self._pending = {}
+        self._last_write = 0.0
+        self._transcribe_started = None
+        self._lock = threading.Lock()
+
+    def start(self, phase: str, **values):
+        """Begin the stage, resetting counters left over from a previous attempt"""
+        self.update(
+            force=True,
+            stage=self.stage,
+            phase=phase,
+            stage_started_at=datetime.utcnow(),
+            **values
+        )
+
+    def update(self, force: bool = False, **values):
+        with self._lock:
+            self._pending.update(values)
+            if not force and time.monotonic() - self._last_write < settings.PROGRESS_UPDATE_SECONDS:
+                return
+            pending, self._pending = self._pending, {}
+            self._last_write = time.monotonic()
+
+        pending["updated_at"] = datetime.utcnow()
+        with session_scope() as db:
+            updated = db.query(MeetingProgress).filter(
+                MeetingProgress.meeting_id == self.meeting_id
+            ).update(pending, synchronize_session=False)
+            if not updated:
+                db.add(MeetingProgress(meeting_id=self.meeting_id, **pending))
+
+    def flush(self):
+        """Write anything still held back by the update interval"""
+        self.update(force=True)
+
+    def decoded(self, seconds: float):
+        self.update(phase="decoding", decoded_seconds=seconds)
+
+    def transcribed(self, windows_done: int, windows_total: int, seconds_done: float, seconds_total: float):
+        if self._transcribe_started is None:
+            self._transcribe_started = time.monotonic()
+
+        values = {
+            "phase": "transcribing",
+            "windows_done": windows_done,
+            "windows_total": windows_total,
+            "transcribed_seconds": seconds_done,
+            "speech_seconds": seconds_total,
+        }
+        if seconds_done:
+            values["real_time_factor"] = (time.monotonic() - self._transcribe_started) / seconds_done
+        # The first and last report are always written so totals appear promptly
+        self.update(force=windows_done in (0, windows_total), **values)
+
+def progress_percent(status: str, progress: Optional[MeetingProgress]) -> int:
+    """Overall 0-100 completion for a meeting"""
+    if status == "completed":
+        return 100
+    if progress is None or progress.stage not in STAGE_WEIGHTS:
+        return 0
+
+    start, end = STAGE_WEIGHTS[progress.stage]
+    fraction = 0.0
+    if progress.stage == "transcribe":
+        if progress.phase == "transcribing" and progress.speech_seconds:
+            fraction = DECODE_WEIGHT + (1 - DECODE_WEIGHT) * progress.transcribed_seconds / progress.speech_seconds
+        elif progress.audio_seconds:
+            fraction = DECODE_WEIGHT
+
+    return int(start + (end - start) * min(fraction, 1.0))
+
+def remaining_seconds(progress: Optional[MeetingProgress]) -> Optional[float]:
+    """Estimated seconds of transcription left, from the measured real-time factor"""
+    if progress is None or progress.phase != "transcribing" or not progress.real_time_factor:
+        return None
+    remaining = (progress.speech_seconds or 0.0) - (progress.transcribed_seconds or 0.0)
+    return max(remaining, 0.0) * progress.real_time_factor
+
+def status_payload(status: str, progress: Optional[MeetingProgress]) -> dict:
+    """Fields of a StatusResponse for a meeting status and its progress row"""
+    payload = {"status": status, "progress": progress_percent(status, progress)}
+    if progress is not None:
+        payload.update(
+            stage=progress.stage,
+            phase=progress.phase,
+            audio_seconds=progress.audio_seconds,
+            decoded_seconds=progress.decoded_seconds,
+            windows_done=progress.windows_done,
+            windows_total=progress.windows_total,
+            real_time_factor=progress.real_time_factor,
+            eta_seconds=remaining_seconds(progress)
+        )
+    return payload
+
+def get_progress(db: Session, meeting_id: str) -> Optional[MeetingProgress]:
+    return db.query(MeetingProgress).filter(MeetingProgress.meeting_id == meeting_id).first()
+
+def meeting_status_payload(db: Session, meeting_id: str) -> Optional[dict]:
+    """StatusResponse fields for a meeting, or None if it doesn't exist"""
+    status = db.query(Meeting.status).filter(Meeting.meeting_id == meeting_id).scalar()
+    if status is None:
+        return None
+    return status_payload(status, get_progress(db, meeting_id))
+
+def transcription_backlog(db: Session) -> dict:
+    """Speech still to transcribe across in-flight meetings and the time it should take"""
+    remaining, rtf = db.query(
+        func.sum(MeetingProgress.speech_seconds - MeetingProgress.transcribed_seconds),
+        func.avg(MeetingProgress.real_time_factor)
+    ).filter(MeetingProgress.phase == "transcribing").one()
+
+    remaining = remaining or 0.0
+    return {
+        "pending_audio_seconds": remaining,
+        "real_time_factor": rtf,
+        "estimated_seconds": remaining * rtf if rtf else None
+    }
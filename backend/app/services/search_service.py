@@ -1,5 +1,5 @@
 from typing import List
-from ai.search.chroma_client import search_client
+from ai.search.chroma_client import get_search_client
 
 def chunk_text(text: str, chunk_size: int = 500) -> List[str]:
     """Split text into chunks"""
@@ -13,8 +13,8 @@ def chunk_text(text: str, chunk_size: int = 500) -> List[str]:
 def store_meeting_vectors(meeting_id: str, transcript: str):
     """Store meeting transcript in vector database"""
     chunks = chunk_text(transcript)
-    search_client.add_documents(meeting_id, chunks)
+    get_search_client().add_documents(meeting_id, chunks)
 
 def search_meeting_content(query: str, meeting_id: str = None):
     """Search meeting content"""
-    return search_client.search(query, meeting_id)
\ No newline at end of file
+    return get_search_client().search(query, meeting_id)
\ No newline at end of file
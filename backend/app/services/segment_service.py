@@ -0,0 +1,69 @@
+from typing import List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.models.transcript import TranscriptSegment
+
+def clear_transcript_segments(db: Session, meeting_id: str):
+    db.query(TranscriptSegment).filter(
+        TranscriptSegment.meeting_id == meeting_id
+    ).delete(synchronize_session=False)
+
+def append_transcript_segments(db: Session, meeting_id: str, segments: List[dict]):
+    """Store segments at the positions given by their "id", as published mid-transcription"""
+    rows = [
+        {
+            "meeting_id": meeting_id,
+            "position": segment.get("id", 0),
+            "start": segment.get("start", 0.0),
+            "end": segment.get("end", 0.0),
+            "text": segment.get("text", "").strip(),
+            "avg_logprob": segment.get("avg_logprob")
+        }
+        for segment in segments
+    ]
+    if rows:
+        # executemany rather than one ORM object per segment
+        db.execute(insert(TranscriptSegment), rows)
+
+def replace_transcript_segments(db: Session, meeting_id: str, segments: List[dict]):
+    """Rewrite a meeting's stored segments from a transcription result"""
+    clear_transcript_segments(db, meeting_id)
+    append_transcript_segments(db, meeting_id, [
+        dict(segment, id=position) for position, segment in enumerate(segments)
+    ])
+
+def list_transcript_segments(
+    db: Session,
+    meeting_id: str,
+    limit: int = 200,
+    cursor: Optional[int] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None
+) -> Tuple[List[TranscriptSegment], Optional[int]]:
+    """A page of segments in order, optionally within a time range, and the next cursor
+
+    The cursor is the position of the last segment returned.
+    """
+    query = db.query(TranscriptSegment).filter(TranscriptSegment.meeting_id == meeting_id)
+    if cursor is not None:
+        query = query.filter(TranscriptSegment.position > cursor)
+    if start is not None:
+        query = query.filter(TranscriptSegment.end > start)
+    if end is not None:
+        query = query.filter(TranscriptSegment.start < end)
+
+    segments = query.order_by(TranscriptSegment.position).limit(limit + 1).all()
+    if len(segments) > limit:
+        return segments[:limit], segments[limit - 1].position
+    return segments, None
+
+def transcript_segment_texts(db: Session, meeting_id: str) -> List[str]:
+    """Texts of a meeting's stored segments, in order"""
+    texts = db.query(TranscriptSegment.text).filter(
+        TranscriptSegment.meeting_id == meeting_id
+    ).order_by(TranscriptSegment.position)
+    return [text for (text,) in texts if text]
+
+def transcript_text(db: Session, meeting_id: str) -> str:
+    """Full transcript text assembled from a meeting's stored segments"""
+    return " ".join(transcript_segment_texts(db, meeting_id))
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Dict, Iterable, Optional, Set
+from app.core.config import settings
+from app.core.database import session_scope
+from app.models.meeting import Meeting
+from app.models.progress import MeetingProgress
+from app.services.progress_service import status_payload
+
+# SQLite caps bound parameters per statement; watched ids are queried in batches
+ID_BATCH_SIZE = 500
+
+class StatusBroker:
+    """In-process pub/sub for meeting status events
+
+    Workers write progress in their own processes, so the broker refreshes
+    every meeting that has at least one subscriber with a single query per
+    settings.STATUS_POLL_SECONDS and pushes only what changed. Status traffic
+    costs the same whether one tab or a thousand are watching.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._latest: Dict[str, dict] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def subscribe(self, meeting_ids: Iterable[str]) -> asyncio.Queue:
+        """Queue receiving {"meeting_id", **status} events for the given meetings"""
+        queue = asyncio.Queue()
+        for meeting_id in meeting_ids:
+            self._subscribers.setdefault(meeting_id, set()).add(queue)
+            # Late subscribers start from the last known state
+            if meeting_id in self._latest:
+                queue.put_nowait(self._latest[meeting_id])
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        # Refresh now so new meetings don't wait a full interval for their first event
+        self._wakeup.set()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        for meeting_id in list(self._subscribers):
+            subscribers = self._subscribers[meeting_id]
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[meeting_id]
+                self._latest.pop(meeting_id, None)
+
+    async def next_change(self, queue: asyncio.Queue, timeout: float):
+        """Wait up to timeout seconds for a subscribed meeting to move past its current state
+
+        Returns at once if the meeting isn't processing, since nothing more will arrive.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        try:
+            current = await asyncio.wait_for(queue.get(), timeout)
+            if current.get("status") != "processing":
+                return
+            await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            pass
+
+    def publish(self, meeting_id: str, event: dict):
+        if meeting_id not in self._subscribers or self._latest.get(meeting_id) == event:
+            return
+        self._latest[meeting_id] = event
+        for queue in self._subscribers.get(meeting_id, ()):
+            queue.put_nowait(event)
+
+    def _load(self, meeting_ids: list) -> Dict[str, dict]:
+        events = {}
+        with session_scope() as db:
+            for i in range(0, len(meeting_ids), ID_BATCH_SIZE):
+                rows = db.query(Meeting.meeting_id, Meeting.status, MeetingProgress).outerjoin(
+                    MeetingProgress, MeetingProgress.meeting_id == Meeting.meeting_id
+                ).filter(Meeting.meeting_id.in_(meeting_ids[i:i + ID_BATCH_SIZE])).all()
+                for meeting_id, status, progress in rows:
+                    events[meeting_id] = dict(status_payload(status, progress), meeting_id=meeting_id)
+        return events
+
+    async def _run(self):
+        loop = asyncio.get_event_loop()
+        while self._subscribers:
+            meeting_ids = list(self._subscribers)
+            try:
+                events = await loop.run_in_executor(None, self._load, meeting_ids)
+            except Exception as e:
+                print(f"Status refresh failed: {e}")
+                events = None
+
+            for meeting_id in meeting_ids if events is not None else ():
+                if meeting_id in events:
+                    self.publish(meeting_id, events[meeting_id])
+                elif meeting_id not in self._latest:
+                    self.publish(meeting_id, {"meeting_id": meeting_id, "status": "not_found", "progress": 0})
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.STATUS_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+status_broker = StatusBroker()
@@ -1,14 +1,52 @@
+import os
 import asyncio
-from ai.transcription.whisper_client import transcriber
+from concurrent.futures import ThreadPoolExecutor
+from app.core.config import settings
+from ai.transcription.audio import decode_to_pcm_cache, pcm_cache_path, PcmAudio
+from ai.transcription.whisper_client import get_transcriber
 
-async def process_transcription(file_path: str) -> str:
-    """Process transcription of audio file using Whisper"""
+# Bounds how many ffmpeg decode processes run at once
+_decode_executor = ThreadPoolExecutor(
+    max_workers=settings.AUDIO_DECODE_WORKERS,
+    thread_name_prefix="audio-decode"
+)
+
+async def process_transcription(file_path: str, model_name: str = None, progress=None,
+                                on_segments=None) -> dict:
+    """Process transcription of audio file using Whisper
+
+    progress, if given, is a ProgressReporter that receives decode and window progress;
+    on_segments receives stitched segments as soon as they are final. Decode
+    and transcription errors are raised for the job queue to retry.
+    """
+    loop = asyncio.get_event_loop()
+    
+    # Single decode stage: any audio/video -> memory-mapped 16 kHz mono PCM cache
+    cache_path = await loop.run_in_executor(
+        _decode_executor, decode_to_pcm_cache, file_path, pcm_cache_path(file_path),
+        progress.decoded if progress else None
+    )
+    audio = PcmAudio(cache_path)
+    if progress:
+        progress.update(force=True, audio_seconds=audio.duration, decoded_seconds=audio.duration)
+    
+    # Run transcription in a thread to avoid blocking
+    transcriber = await loop.run_in_executor(None, get_transcriber)
+    return await loop.run_in_executor(
+        None, transcriber.transcribe, audio, model_name,
+        progress.transcribed if progress else None, on_segments
+    )
+
+def remove_pcm_cache(file_path: str):
+    """Delete the PCM cache decoded from a recording once its transcript is saved
+
+    The cache is kept until then so a retried job skips decoding. A live
+    meeting's recording is itself a PCM file and is never removed.
+    """
+    cache_path = pcm_cache_path(file_path)
+    if os.path.abspath(cache_path) == os.path.abspath(file_path):
+        return
     try:
-        # Run transcription in a thread to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, transcriber.transcribe, file_path)
-        return result["text"]
-    except Exception as e:
-        print(f"Transcription processing error: {e}")
-        # Fallback for demo
-        return "This is a sample transcript from the meeting. Participants discussed various topics including project timelines, budget allocation, and team responsibilities. John mentioned that the marketing campaign needs to be completed by next Friday. Sarah will handle the client presentation. The team agreed to use the new software tool for project management."
\ No newline at end of file
+        os.remove(cache_path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,239 @@
+import os
+import re
+import json
+import math
+import time
+import uuid
+import shutil
+import asyncio
+from typing import AsyncIterator, List, Tuple
+from app.core.config import settings
+from app.services.file_service import FileTooLargeError, upload_file_name
+
+SESSION_FILE = "session.json"
+DATA_FILE = "data.part"
+PART_MARKER = re.compile(r"part_(\d+)\.done$")
+# Suffix of a session directory claimed by the request completing it
+COMPLETING_SUFFIX = ".completing"
+
+# Sessions older than this are swept at most once per interval
+EXPIRY_CHECK_SECONDS = 600
+_last_expiry_check = 0.0
+
+class UploadSessionNotFoundError(Exception):
+    """Raised when a resumable upload session does not exist"""
+    pass
+
+class InvalidUploadPartError(Exception):
+    """Raised when an uploaded part does not match the session layout"""
+    pass
+
+class UploadSessionCompletingError(Exception):
+    """Raised when another request is already completing the upload"""
+    pass
+
+def _sessions_dir() -> str:
+    return os.path.join(settings.UPLOAD_DIR, ".sessions")
+
+def _session_dir(upload_id: str) -> str:
+    # Only accept our own ids so a crafted upload_id can't escape UPLOAD_DIR
+    try:
+        upload_id = str(uuid.UUID(upload_id))
+    except ValueError:
+        raise UploadSessionNotFoundError(upload_id)
+    return os.path.join(_sessions_dir(), upload_id)
+
+def _part_marker(session_dir: str, part_number: int) -> str:
+    return os.path.join(session_dir, f"part_{part_number}.done")
+
+def _part_range(session: dict, part_number: int) -> Tuple[int, int]:
+    """Return (offset, length) of a part within the assembled file"""
+    if part_number < 0 or part_number >= session["total_parts"]:
+        raise InvalidUploadPartError(
+            f"Part {part_number} out of range (0-{session['total_parts'] - 1})"
+        )
+    offset = part_number * session["part_size"]
+    length = min(session["part_size"], session["size"] - offset)
+    return offset, length
+
+def create_upload_session(filename: str, size: int, part_size: int = None, whisper_model: str = None) -> dict:
+    """Create a resumable upload session with a preallocated data file"""
+    filename, _ = upload_file_name(filename)
+    if size <= 0:
+        raise InvalidUploadPartError("Upload size must be positive")
+    if size > settings.MAX_FILE_SIZE:
+        raise FileTooLargeError(
+            f"Upload exceeds maximum size of {settings.MAX_FILE_SIZE} bytes"
+        )
+
+    part_size = part_size or settings.UPLOAD_PART_SIZE
+    # Tiny parts would mean millions of requests and marker files per upload
+    if part_size < min(settings.UPLOAD_MIN_PART_SIZE, size):
+        raise InvalidUploadPartError(
+            f"Part size must be at least {settings.UPLOAD_MIN_PART_SIZE} bytes"
+        )
+    if math.ceil(size / part_size) > settings.UPLOAD_MAX_PARTS:
+        raise InvalidUploadPartError(
+            f"Upload would have more than {settings.UPLOAD_MAX_PARTS} parts; use a larger part size"
+        )
+
+    expire_upload_sessions()
+
+    upload_id = str(uuid.uuid4())
+    session_dir = _session_dir(upload_id)
+    os.makedirs(session_dir)
+
+    session = {
+        "upload_id": upload_id,
+        "filename": filename,
+        "size": size,
+        "part_size": part_size,
+        "total_parts": math.ceil(size / part_size),
+        "whisper_model": whisper_model,
+    }
+
+    # Sparse preallocation: parts are written in place at their offsets,
+    # so finalizing is a rename instead of a concatenation pass
+    with open(os.path.join(session_dir, DATA_FILE), "wb") as data:
+        data.truncate(size)
+
+    with open(os.path.join(session_dir, SESSION_FILE), "w") as f:
+        json.dump(session, f)
+
+    return session
+
+def _is_expired(session_dir: str) -> bool:
+    # Writing or clearing a part marker updates the directory's mtime,
+    # so it tracks the session's last activity
+    return time.time() - os.stat(session_dir).st_mtime > settings.UPLOAD_SESSION_TTL_SECONDS
+
+def get_upload_session(upload_id: str) -> dict:
+    """Load session metadata along with the parts received so far"""
+    session_dir = _session_dir(upload_id)
+    session_path = os.path.join(session_dir, SESSION_FILE)
+    try:
+        with open(session_path) as f:
+            session = json.load(f)
+    except FileNotFoundError:
+        if os.path.isdir(session_dir + COMPLETING_SUFFIX):
+            raise UploadSessionCompletingError(upload_id)
+        raise UploadSessionNotFoundError(upload_id)
+    if _is_expired(session_dir):
+        raise UploadSessionNotFoundError(upload_id)
+
+    # One directory listing rather than a stat per part
+    received = set()
+    for name in os.listdir(session_dir):
+        match = PART_MARKER.match(name)
+        if match:
+            received.add(int(match.group(1)))
+    session["received_parts"] = sorted(received)
+    return session
+
+def expire_upload_sessions(force: bool = False) -> int:
+    """Delete sessions with no activity for settings.UPLOAD_SESSION_TTL_SECONDS
+
+    Runs at most once per EXPIRY_CHECK_SECONDS unless forced; returns how
+    many sessions were removed.
+    """
+    global _last_expiry_check
+    if not force and time.monotonic() - _last_expiry_check < EXPIRY_CHECK_SECONDS:
+        return 0
+    _last_expiry_check = time.monotonic()
+
+    sessions_dir = _sessions_dir()
+    if not os.path.isdir(sessions_dir):
+        return 0
+    expired = 0
+    for entry in os.scandir(sessions_dir):
+        try:
+            if entry.is_dir() and _is_expired(entry.path):
+                shutil.rmtree(entry.path, ignore_errors=True)
+                expired += 1
+        except FileNotFoundError:
+            # Completed or removed while we looked
+            continue
+    return expired
+
+def _write_at(data, offset: int, chunk: bytes):
+    data.seek(offset)
+    data.write(chunk)
+
+def _begin_part(upload_id: str, part_number: int) -> Tuple[str, int, int]:
+    session = get_upload_session(upload_id)
+    offset, length = _part_range(session, part_number)
+    marker = _part_marker(_session_dir(upload_id), part_number)
+
+    # A retried part invalidates any previous copy until it is fully rewritten
+    if os.path.exists(marker):
+        os.remove(marker)
+    return marker, offset, length
+
+async def write_upload_part(upload_id: str, part_number: int, stream: AsyncIterator[bytes]) -> int:
+    """Stream one part into its slot of the data file and mark it received"""
+    loop = asyncio.get_event_loop()
+    # Session files are touched in the executor so the event loop never waits on disk
+    marker, offset, length = await loop.run_in_executor(None, _begin_part, upload_id, part_number)
+    session_dir = _session_dir(upload_id)
+    written = 0
+
+    # Each part gets its own handle, so parts can be uploaded concurrently
+    data = await loop.run_in_executor(None, open, os.path.join(session_dir, DATA_FILE), "r+b")
+    with data:
+        async for chunk in stream:
+            if not chunk:
+                continue
+            if written + len(chunk) > length:
+                raise InvalidUploadPartError(
+                    f"Part {part_number} exceeds expected length of {length} bytes"
+                )
+            await loop.run_in_executor(None, _write_at, data, offset + written, chunk)
+            written += len(chunk)
+
+    if written != length:
+        raise InvalidUploadPartError(
+            f"Part {part_number} is {written} bytes, expected {length}"
+        )
+
+    await loop.run_in_executor(None, _touch, marker)
+    return written
+
+def _touch(path: str):
+    open(path, "w").close()
+
+def complete_upload_session(upload_id: str) -> str:
+    """Move the assembled file into UPLOAD_DIR and return its path
+
+    The session directory is renamed first, which only one request can do,
+    so concurrent completes of the same upload get
+    UploadSessionCompletingError instead of racing over the data file. The
+    claim stays in place until remove_upload_session, once the meeting is
+    recorded.
+    """
+    session = get_upload_session(upload_id)
+    missing = _missing_parts(session)
+    if missing:
+        raise InvalidUploadPartError(f"Missing parts: {missing}")
+
+    _, file_extension = upload_file_name(session["filename"])
+    file_path = os.path.join(settings.UPLOAD_DIR, f"{upload_id}.{file_extension}")
+
+    session_dir = _session_dir(upload_id)
+    claimed_dir = session_dir + COMPLETING_SUFFIX
+    try:
+        os.rename(session_dir, claimed_dir)
+    except FileNotFoundError:
+        raise UploadSessionCompletingError(upload_id)
+    # Renaming keeps the old mtime; refresh it so the expiry sweep leaves the claim alone
+    os.utime(claimed_dir)
+
+    os.replace(os.path.join(claimed_dir, DATA_FILE), file_path)
+    return file_path
+
+def remove_upload_session(upload_id: str):
+    """Delete a completed session's claim"""
+    shutil.rmtree(_session_dir(upload_id) + COMPLETING_SUFFIX, ignore_errors=True)
+
+def _missing_parts(session: dict) -> List[int]:
+    received = set(session["received_parts"])
+    return [i for i in range(session["total_parts"]) if i not in received]
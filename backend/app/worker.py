@@ -0,0 +1,200 @@
+"""Background worker pool for meeting processing.
+
+Run alongside the API with ``python -m app.worker`` from the backend directory.
+Each pipeline stage (transcribe, extract, index) gets the number of worker
+processes set in settings.WORKER_CONCURRENCY. Workers pull jobs from the
+durable queue in the database and enqueue the next stage when done, so the
+stages of different meetings overlap.
+"""
+import os
+import time
+import socket
+import asyncio
+import traceback
+import multiprocessing
+from app.core.config import settings
+from app.core.database import session_scope, engine, init_db
+from app.models.meeting import Meeting
+from app.services.job_queue import (
+    claim_job, complete_job, fail_job, heartbeat_job, recover_stale_jobs, fail_stale_jobs,
+    enqueue_job, has_pending_job, count_queued
+)
+from app.services.processing_service import (
+    transcribe_meeting, extract_meeting, index_meeting,
+    next_stage, resume_stage, mark_meeting_failed
+)
+from app.services.insight_service import backfill_meeting_insights
+from app.services.analytics_service import rebuild_analytics
+
+async def handle_transcribe(job):
+    await transcribe_meeting(job.meeting_id, job.payload["file_path"])
+
+async def handle_extract(job):
+    await extract_meeting(job.meeting_id)
+
+async def handle_index(job):
+    await index_meeting(job.meeting_id)
+
+# Stage name -> coroutine run for each claimed job
+STAGE_HANDLERS = {
+    "transcribe": handle_transcribe,
+    "extract": handle_extract,
+    "index": handle_index,
+}
+
+def parse_concurrency(value: str) -> dict:
+    """Parse "stage=count,stage=count" into a dict"""
+    concurrency = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        stage, _, count = item.partition("=")
+        concurrency[stage.strip()] = int(count or 1)
+    return concurrency
+
+async def _heartbeat(job):
+    """Keep the job's lease fresh so it isn't recovered while still running"""
+    while True:
+        await asyncio.sleep(settings.JOB_LEASE_SECONDS / 3)
+        with session_scope() as db:
+            heartbeat_job(db, job)
+
+async def run_job(job):
+    """Run a claimed job's stage handler while keeping its lease alive"""
+    heartbeat = asyncio.create_task(_heartbeat(job))
+    try:
+        await STAGE_HANDLERS[job.stage](job)
+    finally:
+        heartbeat.cancel()
+
+async def process_job(job, downstream):
+    """Run a claimed job and record its outcome"""
+    try:
+        await run_job(job)
+    except Exception as e:
+        print(f"Job {job.id} ({job.stage}) for {job.meeting_id} failed: {e}")
+        traceback.print_exc()
+        with session_scope() as db:
+            # Insights are already saved when only indexing fails
+            if fail_job(db, job, repr(e)) == "failed" and job.stage != "index":
+                mark_meeting_failed(job.meeting_id, db)
+        return
+
+    # Hand off to the next stage in the same commit that completes this one
+    with session_scope() as db:
+        if not complete_job(db, job):
+            # Our lease expired and another worker has the job now
+            print(f"Job {job.id} ({job.stage}) was recovered while running, not completing it")
+        elif downstream:
+            enqueue_job(db, job.meeting_id, downstream, job.payload)
+
+async def worker_loop(stage: str, worker_id: str):
+    """Claim and run jobs for one stage forever
+
+    Up to the stage's WORKER_JOBS_IN_FLIGHT jobs run at once, so stages
+    that mostly wait on a remote service (extraction on the LLM) keep it
+    busy with a backlog from a single process; each job is still claimed,
+    heartbeated and completed on its own. Sessions are only held for the
+    few queries around a job, never while the stage itself runs, so idle
+    connections don't pile up in the pool.
+    """
+    print(f"Worker {worker_id} started")
+    downstream = next_stage(stage)
+    capacity = max(parse_concurrency(settings.WORKER_JOBS_IN_FLIGHT).get(stage, 1), 1)
+    running = set()
+    last_recovery = 0.0
+    while True:
+        job = None
+        if len(running) < capacity:
+            with session_scope() as db:
+                # Stale leases can't appear faster than the heartbeat interval
+                if time.monotonic() - last_recovery >= settings.JOB_LEASE_SECONDS / 3:
+                    recover_stale_jobs(db)
+                    for meeting_id, failed_stage in fail_stale_jobs(db):
+                        if failed_stage != "index":
+                            mark_meeting_failed(meeting_id, db)
+                    last_recovery = time.monotonic()
+
+                # Backpressure: let a slower downstream stage catch up before producing more
+                blocked = downstream and count_queued(db, downstream) >= settings.STAGE_QUEUE_LIMIT
+                job = None if blocked else claim_job(db, stage, worker_id)
+        
+        if job is not None:
+            # Keep claiming while there is room, so a backlog fills every slot at once
+            running.add(asyncio.create_task(process_job(job, downstream)))
+            continue
+        
+        if running:
+            _, running = await asyncio.wait(
+                running, timeout=settings.WORKER_POLL_SECONDS, return_when=asyncio.FIRST_COMPLETED
+            )
+        else:
+            await asyncio.sleep(settings.WORKER_POLL_SECONDS)
+
+def resume_orphaned_meetings() -> int:
+    """Requeue meetings left 'processing' with no queued or running job"""
+    with session_scope() as db:
+        resumed = 0
+        meetings = db.query(
+            Meeting.meeting_id,
+            Meeting.file_path,
+            Meeting.transcript.isnot(None)
+        ).filter(
+            Meeting.status == "processing",
+            Meeting.file_path.isnot(None)
+        ).all()
+        for meeting_id, file_path, has_transcript in meetings:
+            if not has_pending_job(db, meeting_id):
+                stage = resume_stage(bool(has_transcript))
+                enqueue_job(db, meeting_id, stage, {"file_path": file_path})
+                resumed += 1
+        return resumed
+
+def _worker_main(stage: str):
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{stage}"
+    asyncio.run(worker_loop(stage, worker_id))
+
+def main():
+    init_db()
+    resumed = resume_orphaned_meetings()
+    if resumed:
+        print(f"Resumed {resumed} interrupted meetings")
+    backfilled = backfill_meeting_insights()
+    if backfilled:
+        print(f"Normalized insights for {backfilled} meetings")
+    if rebuild_analytics():
+        print("Built analytics aggregates from existing meetings")
+
+    # Don't share pooled connections with forked children
+    engine.dispose()
+
+    processes = {}
+
+    def spawn(stage: str, index: int):
+        process = multiprocessing.Process(
+            target=_worker_main, args=(stage,),
+            name=f"worker-{stage}-{index}", daemon=True
+        )
+        process.start()
+        processes[(stage, index)] = process
+
+    for stage, count in parse_concurrency(settings.WORKER_CONCURRENCY).items():
+        if stage not in STAGE_HANDLERS:
+            raise ValueError(f"Unknown worker stage: {stage}")
+        for index in range(count):
+            spawn(stage, index)
+
+    try:
+        # Restart workers that die; their jobs are recovered once the lease expires
+        while True:
+            time.sleep(5)
+            for (stage, index), process in list(processes.items()):
+                if not process.is_alive():
+                    print(f"Worker {process.name} exited with {process.exitcode}, restarting")
+                    spawn(stage, index)
+    except KeyboardInterrupt:
+        for process in processes.values():
+            process.terminate()
+
+if __name__ == "__main__":
+    main()
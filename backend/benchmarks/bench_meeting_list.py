@@ -0,0 +1,100 @@
+"""Meeting list and status queries against a large archive
+
+Seeds --meetings meetings, each with a transcript and insights, then times
+list_meetings_page and meeting_status_payload against loading full rows
+the way the handlers used to. Reports latency percentiles and the Python
+memory each query allocates at its peak.
+
+    python benchmarks/bench_meeting_list.py --meetings 100000
+"""
+import argparse
+import gc
+import random
+import resource
+import time
+import tracemalloc
+
+from common import use_database, seed_meetings, latency_summary
+
+def measure(label: str, query, repeat: int):
+    """Time query() repeat times; report latency and its peak allocation"""
+    query()  # warm the page cache and SQLAlchemy's statement cache
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query()
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    query()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} {latency_summary(timings)}  peak {peak / 1024:9.1f} KB")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=100000)
+    parser.add_argument("--transcript-chars", type=int, default=5000,
+                        help="transcript size per meeting; an hour of speech is around 50000")
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = use_database(args.database_url)
+    from sqlalchemy.orm import undefer_group
+    from app.core.database import SessionLocal
+    from app.models.meeting import Meeting
+    from app.services.meeting_service import list_meetings_page
+    from app.services.progress_service import meeting_status_payload, status_payload, get_progress
+
+    print(f"Seeding {args.meetings} meetings into {url}")
+    started = time.perf_counter()
+    meeting_ids = seed_meetings(args.meetings, args.transcript_chars)
+    print(f"Seeded in {time.perf_counter() - started:.1f}s\n")
+
+    db = SessionLocal()
+    rng = random.Random(1)
+
+    # A cursor deep in the archive: the last row of the page at the middle
+    middle = db.query(Meeting.id).order_by(Meeting.created_at.desc(), Meeting.id.desc()).offset(
+        args.meetings // 2
+    ).limit(1).scalar()
+    deep_cursor = str(middle) if middle is not None else None
+
+    def page(cursor=None):
+        list_meetings_page(db, args.limit, cursor)
+        db.expunge_all()
+
+    def full_rows(offset=0):
+        db.query(Meeting).options(undefer_group("content")).order_by(
+            Meeting.created_at.desc(), Meeting.id.desc()
+        ).offset(offset).limit(args.limit).all()
+        db.expunge_all()
+
+    def status():
+        meeting_status_payload(db, rng.choice(meeting_ids))
+
+    def status_full_row():
+        meeting_id = rng.choice(meeting_ids)
+        meeting = db.query(Meeting).options(undefer_group("content")).filter(
+            Meeting.meeting_id == meeting_id
+        ).first()
+        status_payload(meeting.status, get_progress(db, meeting_id))
+        db.expunge_all()
+
+    print(f"Pages of {args.limit}, {args.repeat} runs each")
+    measure("list: first page", page, args.repeat)
+    measure("list: first page, full rows", full_rows, args.repeat)
+    measure("list: middle page (cursor)", lambda: page(deep_cursor), args.repeat)
+    measure("list: middle page, full rows (offset)", lambda: full_rows(args.meetings // 2), args.repeat)
+    measure("status", status, args.repeat)
+    measure("status, full row", status_full_row, args.repeat)
+
+    db.close()
+    # ru_maxrss is in kilobytes on Linux
+    print(f"\nProcess max RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Startup time of the API and worker modules
+
+Each import runs in a fresh interpreter, so nothing is already cached in
+sys.modules, and the median of several runs is reported. Heavy ML
+dependencies (torch, whisper, chromadb) must not load at startup: they are
+imported when the first job or search needs them, and the benchmark fails
+if any of them shows up.
+
+    python benchmarks/bench_startup.py --runs 5 --target-seconds 2
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from common import BACKEND_DIR, REPO_DIR, use_database
+
+MODULES = ["app.main", "app.api.routes", "app.worker"]
+HEAVY_MODULES = ["torch", "whisper", "chromadb", "sentence_transformers"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def time_import(module: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([BACKEND_DIR, REPO_DIR]))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    # Modules may print while importing; the result is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--target-seconds", type=float, default=None,
+                        help="exit non-zero if any median import time exceeds this")
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    use_database(args.database_url)
+    failed = False
+    for module in args.modules:
+        try:
+            results = [time_import(module) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{module:<20} import failed:\n{e.stderr}")
+            failed = True
+            continue
+        times = [result["seconds"] for result in results]
+        heavy = sorted({name for result in results for name in result["heavy"]})
+        print(
+            f"{module:<20} median {statistics.median(times):6.3f}s  "
+            f"min {min(times):6.3f}s  max {max(times):6.3f}s"
+            + (f"  loaded at startup: {', '.join(heavy)}" if heavy else "")
+        )
+        if heavy or (args.target_seconds is not None and statistics.median(times) > args.target_seconds):
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Helpers shared by the benchmark scripts
+
+Run the scripts from the backend directory, e.g.
+``python benchmarks/bench_startup.py``. They never touch the configured
+database: each works on a scratch SQLite file unless --database-url is given.
+"""
+import os
+import sys
+import math
+import random
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(BACKEND_DIR)
+
+# app.* lives in backend/, ai.* at the repository root
+for path in (REPO_DIR, BACKEND_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+WORDS = (
+    "we should ship the release candidate by friday and sarah will follow up with the client "
+    "about budget approval while the team reviews the roadmap timeline and open action items"
+).split()
+
+def use_database(url: str = None) -> str:
+    """Point the app at url, or at a fresh scratch SQLite file
+
+    Must run before any app module is imported, since settings and engines
+    are created at import time.
+    """
+    if url is None:
+        url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="meeting-bench-"), "bench.db")
+    os.environ["DATABASE_URL"] = url
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    return url
+
+def sample_transcript(chars: int, rng: random.Random) -> str:
+    words = []
+    size = 0
+    while size < chars:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+def seed_meetings(count: int, transcript_chars: int, batch_size: int = 2000) -> List[str]:
+    """Insert count meetings with transcripts and insight JSON; returns their meeting ids
+
+    Most are completed, with some processing and failed, one minute apart.
+    """
+    from sqlalchemy import insert
+    from app.core.database import init_db, engine
+    from app.models.meeting import Meeting
+
+    init_db()
+    rng = random.Random(0)
+    # A handful of distinct transcripts is enough; every row still stores its own copy
+    transcripts = [sample_transcript(transcript_chars, rng) for _ in range(8)]
+    statuses = ["completed"] * 8 + ["processing", "failed"]
+    first = datetime.utcnow() - timedelta(minutes=count)
+    meeting_ids = []
+
+    with engine.begin() as connection:
+        for offset in range(0, count, batch_size):
+            rows = []
+            for i in range(offset, min(offset + batch_size, count)):
+                meeting_id = str(uuid.uuid4())
+                meeting_ids.append(meeting_id)
+                rows.append({
+                    "meeting_id": meeting_id,
+                    "filename": f"meeting-{i}.mp3",
+                    "status": statuses[i % len(statuses)],
+                    "transcript": transcripts[i % len(transcripts)],
+                    "action_items": [
+                        {"assignee": "Sarah Johnson", "task": f"Follow up on item {i}", "deadline": "Friday"},
+                        {"assignee": "John Smith", "task": "Update the roadmap", "deadline": None},
+                    ],
+                    "decisions": [{"decision": "Ship the release candidate", "made_by": "Team"}],
+                    "participants": [{"name": "Sarah Johnson", "role": "PM"}, {"name": "John Smith", "role": "Engineer"}],
+                    "topics": ["Roadmap", "Budget", "Release"],
+                    "created_at": first + timedelta(minutes=i),
+                })
+            connection.execute(insert(Meeting), rows)
+
+    engine.dispose()
+    return meeting_ids
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def latency_summary(seconds: List[float]) -> str:
+    if not seconds:
+        return "no samples"
+    return "  ".join(
+        f"{name} {percentile(seconds, pct) * 1000:8.2f} ms"
+        for name, pct in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100))
+    )
+
+def create_app():
+    """The API as deployed by app/main.py"""
+    from app.main import app
+    return app
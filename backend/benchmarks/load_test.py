@@ -0,0 +1,121 @@
+"""Latency of /meetings and /meetings/{id}/status under concurrent load
+
+Seeds a scratch database and serves the API from it with uvicorn, or
+targets a running server with --url. Client threads then request the
+first page of meetings and the status of random meetings for --duration
+seconds, and the p50/p95/p99 latency of each endpoint is reported.
+
+    python benchmarks/load_test.py --meetings 10000 --concurrency 32 --duration 30
+"""
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+from common import BACKEND_DIR, REPO_DIR, use_database, seed_meetings, latency_summary
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    """uvicorn serving common.create_app, which uses the DATABASE_URL set by use_database"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([BACKEND_DIR, REPO_DIR]))
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "common:create_app", "--factory",
+            "--app-dir", BENCHMARKS_DIR, "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning", "--no-access-log"
+        ],
+        cwd=BACKEND_DIR, env=env
+    )
+
+def wait_until_up(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"{url}/api/meetings", params={"limit": 1}, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not start within {timeout}s")
+
+def client(url: str, meeting_ids: list, limit: int, stop_at: float, results: dict, seed: int):
+    """Alternate list and status requests until stop_at, recording latencies"""
+    rng = random.Random(seed)
+    http = requests.Session()
+    while time.monotonic() < stop_at:
+        for endpoint, path, params in (
+            ("/meetings", "/api/meetings", {"limit": limit}),
+            ("/status", f"/api/meetings/{rng.choice(meeting_ids)}/status", None),
+        ):
+            started = time.perf_counter()
+            try:
+                ok = http.get(url + path, params=params, timeout=30).status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - started
+            # list.append is atomic, so threads can share the result lists
+            (results[endpoint] if ok else results["errors"]).append(elapsed)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="running server to test, e.g. http://localhost:8000")
+    parser.add_argument("--meetings", type=int, default=10000, help="meetings to seed when starting a server")
+    parser.add_argument("--transcript-chars", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=32, help="client threads")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--limit", type=int, default=50, help="page size for /meetings")
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = args.url.rstrip("/")
+        page = requests.get(f"{url}/api/meetings", params={"limit": 1000}, timeout=30).json()
+        meeting_ids = [meeting["meeting_id"] for meeting in page["meetings"]]
+        if not meeting_ids:
+            sys.exit(f"{url} has no meetings to query")
+    else:
+        database_url = use_database(args.database_url)
+        print(f"Seeding {args.meetings} meetings into {database_url}")
+        meeting_ids = seed_meetings(args.meetings, args.transcript_chars)
+        url = f"http://127.0.0.1:{free_port()}"
+        server = start_server(int(url.rsplit(":", 1)[1]), args.workers)
+
+    try:
+        wait_until_up(url)
+        print(f"{args.concurrency} clients against {url} for {args.duration:.0f}s")
+        results = {"/meetings": [], "/status": [], "errors": []}
+        stop_at = time.monotonic() + args.duration
+        threads = [
+            threading.Thread(target=client, args=(url, meeting_ids, args.limit, stop_at, results, i))
+            for i in range(args.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    for endpoint in ("/meetings", "/status"):
+        timings = results[endpoint]
+        print(f"{endpoint:<10} {len(timings) / args.duration:8.1f} req/s  {latency_summary(timings)}")
+    print(f"errors     {len(results['errors'])}")
+    sys.exit(1 if results["errors"] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# app.* lives in backend/, ai.* at the repository root
+sys.path[:0] = [BACKEND_DIR, os.path.dirname(BACKEND_DIR)]
+
+# Settings and engines are created at import time, so point them at a
+# scratch database before any test imports the app
+_scratch = tempfile.mkdtemp(prefix="meeting-tests-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(_scratch, "test.db")
+os.environ["UPLOAD_DIR"] = os.path.join(_scratch, "uploads")
+os.environ.pop("ASYNC_DATABASE_URL", None)
@@ -0,0 +1,43 @@
+from datetime import timedelta, timezone
+
+import pytest
+
+from app.core.database import init_db, session_scope
+from app.models.meeting import Meeting
+from app.services.meeting_service import list_meetings_page
+
+@pytest.fixture
+def meeting():
+    """A meeting whose created_at comes from the server default, as in production"""
+    init_db()
+    with session_scope() as db:
+        db.query(Meeting).delete()
+        db.add(Meeting(meeting_id="m1", filename="standup.mp3", status="completed"))
+    with session_scope() as db:
+        return db.query(Meeting).filter(Meeting.meeting_id == "m1").one()
+
+def listed(**filters):
+    with session_scope() as db:
+        meetings, _ = list_meetings_page(db, 10, **filters)
+        return [m.meeting_id for m in meetings]
+
+def test_created_after_includes_equal_timestamp(meeting):
+    assert listed(created_after=meeting.created_at) == ["m1"]
+
+def test_created_before_excludes_equal_timestamp(meeting):
+    assert listed(created_before=meeting.created_at) == []
+
+def test_fractional_bounds_compare_at_stored_precision(meeting):
+    assert listed(created_after=meeting.created_at.replace(microsecond=500000)) == ["m1"]
+    assert listed(created_before=meeting.created_at + timedelta(seconds=1)) == ["m1"]
+
+def test_aware_bounds_are_converted_to_utc(meeting):
+    created_utc = meeting.created_at.replace(tzinfo=timezone.utc)
+    plus_two = timezone(timedelta(hours=2))
+    before = (created_utc - timedelta(seconds=1)).astimezone(plus_two)
+    after = (created_utc + timedelta(seconds=1)).astimezone(plus_two)
+
+    assert listed(created_after=before) == ["m1"]
+    assert listed(created_after=after) == []
+    assert listed(created_before=after) == ["m1"]
+    assert listed(created_before=before) == []
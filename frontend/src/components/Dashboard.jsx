@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { listMeetings, getMeetingStatus } from '../services/api';
+import { listMeetings, getAnalytics, subscribeMeetingStatus } from '../services/api';
 import { PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
 
 const Dashboard = () => {
@@ -10,28 +10,51 @@ const Dashboard = () => {
     pending: 0,
     failed: 0
   });
+  const [topicData, setTopicData] = useState([]);
 
   useEffect(() => {
     loadMeetings();
+    loadAnalytics();
   }, []);
 
+  // One stream for every meeting still processing, instead of a poll per meeting
+  const processingIds = meetings.filter(m => m.status === 'processing').map(m => m.meeting_id);
+  useEffect(() => {
+    if (!processingIds.length) return undefined;
+    return subscribeMeetingStatus(processingIds, (event) => {
+      if (event.status === 'processing' || event.status === 'not_found') return;
+      setMeetings(current => current.map(m => (
+        m.meeting_id === event.meeting_id ? { ...m, status: event.status } : m
+      )));
+      loadAnalytics();
+    });
+  }, [processingIds.join(',')]);
+
   const loadMeetings = async () => {
     try {
-      const data = await listMeetings();
-      setMeetings(data);
-      
-      // Calculate stats
-      const total = data.length;
-      const processed = data.filter(m => m.status === 'completed').length;
-      const pending = data.filter(m => m.status === 'processing').length;
-      const failed = data.filter(m => m.status === 'failed').length;
-      
-      setStats({ total, processed, pending, failed });
+      const { meetings: page } = await listMeetings({ limit: 5 });
+      setMeetings(page);
     } catch (error) {
       console.error('Failed to load meetings:', error);
     }
   };
 
+  // Totals and charts come pre-aggregated from the server, whatever the archive size
+  const loadAnalytics = async () => {
+    try {
+      const analytics = await getAnalytics();
+      setStats({
+        total: analytics.total_meetings,
+        processed: analytics.completed,
+        pending: analytics.processing,
+        failed: analytics.failed
+      });
+      setTopicData(analytics.topics);
+    } catch (error) {
+      console.error('Failed to load analytics:', error);
+    }
+  };
+
   const statusColors = {
     completed: '#10B981',
     processing: '#F59E0B',
@@ -46,14 +69,6 @@ const Dashboard = () => {
     { name: 'Failed', value: stats.failed }
   ];
 
-  const topicData = [
-    { name: 'Project Planning', count: 12 },
-    { name: 'Budget Review', count: 8 },
-    { name: 'Team Updates', count: 15 },
-    { name: 'Client Meetings', count: 7 },
-    { name: 'Product Development', count: 10 }
-  ];
-
   return (
     <div className="space-y-6">
       <div className="grid grid-cols-1 md:grid-cols-4 gap-6">
@@ -134,7 +149,7 @@ const Dashboard = () => {
               </tr>
             </thead>
             <tbody className="bg-white divide-y divide-gray-200">
-              {meetings.slice(0, 5).map((meeting) => (
+              {meetings.map((meeting) => (
                 <tr key={meeting.id}>
                   <td className="px-6 py-4 whitespace-nowrap">
                     <div className="text-sm font-medium text-gray-900">{meeting.filename}</div>
@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import { uploadFile } from '../services/api';
+import { uploadMeeting } from '../services/api';
 
 const FileUpload = ({ onUploadSuccess }) => {
   const [file, setFile] = useState(null);
@@ -17,7 +17,7 @@ const FileUpload = ({ onUploadSuccess }) => {
     setUploadProgress(0);
 
     try {
-      const result = await uploadFile(file);
+      const result = await uploadMeeting(file, setUploadProgress);
       onUploadSuccess(result.meeting_id);
       
       // Simulate progress
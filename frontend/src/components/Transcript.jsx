@@ -0,0 +1,103 @@
+import React, { useState, useEffect } from 'react';
+import { getTranscript } from '../services/api';
+
+const PAGE_SIZE = 200;
+const LIVE_WAIT_SECONDS = 25;
+
+const formatTime = (seconds) => {
+  const total = Math.floor(seconds);
+  const h = Math.floor(total / 3600);
+  const m = Math.floor((total % 3600) / 60);
+  const s = String(total % 60).padStart(2, '0');
+  return h ? `${h}:${String(m).padStart(2, '0')}:${s}` : `${m}:${s}`;
+};
+
+const Transcript = ({ meetingId, processing }) => {
+  const [segments, setSegments] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    if (meetingId) {
+      setSegments([]);
+      loadPage();
+    }
+  }, [meetingId]);
+
+  // While transcription runs, follow the end of the transcript as windows finish
+  const lastPosition = segments.length ? segments[segments.length - 1].position : undefined;
+  useEffect(() => {
+    if (!processing || loading || nextCursor != null) return undefined;
+    let cancelled = false;
+    const follow = async () => {
+      try {
+        const data = await getTranscript(meetingId, {
+          cursor: lastPosition, limit: PAGE_SIZE, wait: LIVE_WAIT_SECONDS,
+        });
+        if (cancelled) return;
+        setSegments(current => [...current, ...data.segments]);
+        setNextCursor(data.next_cursor);
+        if (!data.segments.length) setTimeout(() => !cancelled && follow(), 1000);
+      } catch (error) {
+        console.error('Failed to follow transcript:', error);
+      }
+    };
+    follow();
+    return () => { cancelled = true; };
+  }, [processing, loading, nextCursor, lastPosition]);
+
+  // Only one page is fetched at a time, so long meetings render immediately
+  const loadPage = async (cursor) => {
+    try {
+      setLoading(true);
+      const data = await getTranscript(meetingId, { cursor, limit: PAGE_SIZE });
+      setSegments(current => (cursor == null ? data.segments : [...current, ...data.segments]));
+      setNextCursor(data.next_cursor);
+    } catch (error) {
+      console.error('Failed to load transcript:', error);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  if (loading && segments.length === 0) {
+    return <div className="text-center py-8">Loading transcript...</div>;
+  }
+
+  return (
+    <div className="bg-white rounded-lg shadow">
+      <div className="px-6 py-4 border-b border-gray-200">
+        <h3 className="text-lg font-medium text-gray-900">Transcript</h3>
+      </div>
+      <div className="p-6">
+        {segments.length === 0 ? (
+          <p className="text-gray-500 text-center py-8">
+            {processing ? 'Waiting for the first words...' : 'No transcript available for this meeting.'}
+          </p>
+        ) : (
+          <div className="space-y-2">
+            {segments.map((segment) => (
+              <div key={segment.position} className="flex text-sm">
+                <span className="w-20 flex-shrink-0 text-gray-400 font-mono">{formatTime(segment.start)}</span>
+                <p className="text-gray-700">{segment.text}</p>
+              </div>
+            ))}
+          </div>
+        )}
+        {nextCursor != null && (
+          <div className="text-center mt-6">
+            <button
+              onClick={() => loadPage(nextCursor)}
+              disabled={loading}
+              className="px-4 py-2 text-sm font-medium text-blue-600 border border-blue-600 rounded-md hover:bg-blue-50 disabled:opacity-50"
+            >
+              {loading ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
+      </div>
+    </div>
+  );
+};
+
+export default Transcript;
@@ -1,20 +1,21 @@
 import React, { useState, useEffect } from 'react';
 import { useParams } from 'react-router-dom';
-import { getMeetingDetails, getMeetingStatus } from '../services/api';
+import { getMeetingDetails, subscribeMeetingStatus } from '../services/api';
 import ActionItems from '../components/ActionItems';
 import Analytics from '../components/Analytics';
 import Search from '../components/Search';
+import Transcript from '../components/Transcript';
 
 const MeetingDetails = () => {
   const { meetingId } = useParams();
   const [meeting, setMeeting] = useState(null);
   const [status, setStatus] = useState('processing');
+  const [progress, setProgress] = useState(null);
   const [activeTab, setActiveTab] = useState('actionItems');
 
   useEffect(() => {
     loadMeetingDetails();
-    const interval = setInterval(checkStatus, 5000);
-    return () => clearInterval(interval);
+    return subscribeMeetingStatus([meetingId], handleStatus);
   }, [meetingId]);
 
   const loadMeetingDetails = async () => {
@@ -26,19 +27,24 @@ const MeetingDetails = () => {
     }
   };
 
-  const checkStatus = async () => {
-    try {
-      const statusData = await getMeetingStatus(meetingId);
-      setStatus(statusData.status);
-      
-      if (statusData.status === 'completed' && !meeting) {
-        loadMeetingDetails();
-      }
-    } catch (error) {
-      console.error('Failed to check status:', error);
+  const handleStatus = (statusData) => {
+    setStatus(statusData.status);
+    setProgress(statusData);
+    
+    // Insights are written when processing completes
+    if (statusData.status === 'completed') {
+      loadMeetingDetails();
     }
   };
 
+  const progressLabel = () => {
+    if (!progress || !progress.phase) return null;
+    let label = `${progress.progress}% · ${progress.phase}`;
+    if (progress.windows_total) label += ` (${progress.windows_done}/${progress.windows_total} windows)`;
+    if (progress.eta_seconds != null) label += ` · about ${Math.ceil(progress.eta_seconds / 60)} min left`;
+    return label;
+  };
+
   if (!meeting && status === 'processing') {
     return (
       <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
@@ -48,6 +54,14 @@ const MeetingDetails = () => {
           <p className="mt-2 text-gray-600">
             We're analyzing your meeting recording. This may take a few minutes...
           </p>
+          {progress && (
+            <div className="mt-4 max-w-md mx-auto">
+              <div className="w-full bg-gray-200 rounded-full h-2">
+                <div className="bg-blue-600 h-2 rounded-full" style={{ width: `${progress.progress}%` }}></div>
+              </div>
+              <p className="mt-2 text-sm text-gray-500">{progressLabel()}</p>
+            </div>
+          )}
         </div>
       </div>
     );
@@ -81,6 +95,9 @@ const MeetingDetails = () => {
           <span className="ml-4 text-sm text-gray-500">
             Created: {new Date(meeting.created_at).toLocaleDateString()}
           </span>
+          {meeting.status === 'processing' && progressLabel() && (
+            <span className="ml-4 text-sm text-gray-500">{progressLabel()}</span>
+          )}
         </div>
       </div>
 
@@ -106,6 +123,16 @@ const MeetingDetails = () => {
           >
             Analytics
           </button>
+          <button
+            onClick={() => setActiveTab('transcript')}
+            className={`py-4 px-1 border-b-2 font-medium text-sm ${
+              activeTab === 'transcript'
+                ? 'border-blue-500 text-blue-600'
+                : 'border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
+            }`}
+          >
+            Transcript
+          </button>
           <button
             onClick={() => setActiveTab('search')}
             className={`py-4 px-1 border-b-2 font-medium text-sm ${
@@ -121,6 +148,7 @@ const MeetingDetails = () => {
 
       {activeTab === 'actionItems' && <ActionItems meetingId={meetingId} />}
       {activeTab === 'analytics' && <Analytics meetingId={meetingId} />}
+      {activeTab === 'transcript' && <Transcript meetingId={meetingId} processing={status === 'processing'} />}
       {activeTab === 'search' && <Search meetingId={meetingId} />}
     </div>
   );
@@ -21,18 +21,89 @@ export const uploadFile = async (file) => {
   return response.data;
 };
 
+const RESUMABLE_THRESHOLD = 32 * 1024 * 1024;
+const PARALLEL_PARTS = 4;
+const PART_RETRIES = 3;
+
+const uploadPart = async (uploadId, partNumber, blob) => {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      await api.put(`/uploads/${uploadId}/parts/${partNumber}`, blob, {
+        headers: { 'Content-Type': 'application/octet-stream' },
+      });
+      return;
+    } catch (error) {
+      if (attempt >= PART_RETRIES) throw error;
+    }
+  }
+};
+
+export const uploadFileResumable = async (file, onProgress) => {
+  const { data: session } = await api.post('/uploads', {
+    filename: file.name,
+    size: file.size,
+  });
+
+  // Upload parts in parallel; only a failed part is retried
+  const pending = [...Array(session.total_parts).keys()];
+  let done = 0;
+  const worker = async () => {
+    while (pending.length) {
+      const partNumber = pending.shift();
+      const start = partNumber * session.part_size;
+      await uploadPart(session.upload_id, partNumber, file.slice(start, start + session.part_size));
+      done += 1;
+      if (onProgress) onProgress(Math.round((done / session.total_parts) * 100));
+    }
+  };
+  await Promise.all(Array.from({ length: PARALLEL_PARTS }, worker));
+
+  const response = await api.post(`/uploads/${session.upload_id}/complete`);
+  return response.data;
+};
+
+export const uploadMeeting = (file, onProgress) =>
+  file.size > RESUMABLE_THRESHOLD ? uploadFileResumable(file, onProgress) : uploadFile(file);
+
 export const getMeetingStatus = async (meetingId) => {
   const response = await api.get(`/meetings/${meetingId}/status`);
   return response.data;
 };
 
-export const getMeetingDetails = async (meetingId) => {
-  const response = await api.get(`/meetings/${meetingId}`);
+export const getAnalytics = async ({ days = 30, top = 10 } = {}) => {
+  const response = await api.get('/analytics', { params: { days, top } });
+  return response.data;
+};
+
+// Pushes {meeting_id, status, progress, ...} events as they change; returns a function
+// that closes the stream. EventSource reconnects on its own after network errors.
+export const subscribeMeetingStatus = (meetingIds, onStatus) => {
+  const params = meetingIds.map((id) => `meeting_ids=${encodeURIComponent(id)}`).join('&');
+  const source = new EventSource(`${API_BASE_URL}/meetings/status/stream?${params}`);
+  source.addEventListener('status', (event) => onStatus(JSON.parse(event.data)));
+  return () => source.close();
+};
+
+// The transcript is paged separately through getTranscript, so it's skipped by default
+export const getMeetingDetails = async (meetingId, { includeTranscript = false } = {}) => {
+  const response = await api.get(`/meetings/${meetingId}`, {
+    params: { include_transcript: includeTranscript },
+  });
+  return response.data;
+};
+
+// Resolves to { segments, next_cursor }; pass next_cursor back as cursor for the next page
+// wait (seconds) long-polls for new segments while the meeting is still transcribing
+export const getTranscript = async (meetingId, { cursor, limit = 200, start, end, wait } = {}) => {
+  const response = await api.get(`/meetings/${meetingId}/transcript`, {
+    params: { cursor, limit, start, end, wait },
+  });
   return response.data;
 };
 
-export const listMeetings = async (skip = 0, limit = 100) => {
-  const response = await api.get(`/meetings?skip=${skip}&limit=${limit}`);
+// Resolves to { meetings, next_cursor }; pass next_cursor back as cursor for the next page
+export const listMeetings = async ({ cursor, limit = 100, status } = {}) => {
+  const response = await api.get('/meetings', { params: { cursor, limit, status } });
   return response.data;
 };
 